@@ -12,6 +12,7 @@ import numpy as np
 import matplotlib
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
+from matplotlib.font_manager import FontProperties
 from matplotlib.patches import FancyBboxPatch, FancyArrowPatch
 from saxsabs.constants import NIST_SRM3600_DATA
 
@@ -36,6 +37,15 @@ def make_workflow_figure():
     c_border = "#455A64"
     c_arrow  = "#37474F"
 
+    # Reuse one FontProperties per (size, bold) instead of one per text artist.
+    fonts = {}
+
+    def font(size, bold=False):
+        key = (size, bold)
+        if key not in fonts:
+            fonts[key] = FontProperties(weight="bold" if bold else "normal", size=size)
+        return fonts[key]
+
     def box(x, y, w, h, text, color, fontsize=9, bold=False):
         bx = FancyBboxPatch(
             (x - w/2, y - h/2), w, h,
@@ -43,9 +53,8 @@ def make_workflow_figure():
             facecolor=color, edgecolor=c_border, linewidth=1.2,
         )
         ax.add_patch(bx)
-        weight = "bold" if bold else "normal"
         ax.text(x, y, text, ha="center", va="center",
-                fontsize=fontsize, fontweight=weight, color="#212121",
+                fontproperties=font(fontsize, bold), color="#212121",
                 wrap=True)
         return bx
 
@@ -111,7 +120,8 @@ def make_workflow_figure():
         bx = FancyBboxPatch((lx, 6.65), 0.7, 0.25, boxstyle="round,pad=0.05",
                             facecolor=lc, edgecolor=c_border, linewidth=0.8)
         ax.add_patch(bx)
-        ax.text(lx + 0.75 + 0.08, 6.775, lt, fontsize=7.5, va="center", color="#424242")
+        ax.text(lx + 0.75 + 0.08, 6.775, lt, fontproperties=font(7.5), va="center",
+                color="#424242")
 
     fig.savefig(OUT_DIR / "fig_workflow.png", dpi=300, bbox_inches="tight",
                 facecolor="white", pad_inches=0.15)
@@ -129,31 +139,48 @@ Q_REF = NIST_SRM3600_DATA[:, 0]
 I_REF = NIST_SRM3600_DATA[:, 1]
 
 
-def make_kfactor_figure():
-    np.random.seed(42)
+def simulate_kfactor(q_ref, i_ref, k_true, seed=42, n_dense=200):
+    """Simulate one noisy measurement and its MAD-filtered K estimate.
 
-    # ── Simulate a measured profile (K_true ≈ 0.035, with noise + 2 outliers) ──
-    K_TRUE = 0.035
-    q_dense = np.linspace(0.006, 0.260, 200)
-    i_ref_dense = np.interp(q_dense, Q_REF, I_REF)
-    noise = 1 + np.random.normal(0, 0.03, size=q_dense.shape)
-    i_meas_dense = i_ref_dense / K_TRUE * noise
+    Kept free of plotting so Monte Carlo studies can sweep ``k_true`` or
+    ``seed`` without rebuilding the figure.
+    """
+    rng = np.random.RandomState(seed)
+
+    # ── Simulate a measured profile (noise + 2 outliers) ──
+    q_dense = np.linspace(0.006, 0.260, n_dense)
+    i_ref_dense = np.interp(q_dense, q_ref, i_ref)
+    noise = 1 + rng.normal(0, 0.03, size=q_dense.shape)
+    i_meas_dense = i_ref_dense / k_true * noise
 
     # Interpolate measured onto reference grid
-    i_meas_at_ref = np.interp(Q_REF, q_dense, i_meas_dense)
-    ratios = I_REF / i_meas_at_ref
+    i_meas_at_ref = np.interp(q_ref, q_dense, i_meas_dense)
+    ratios = i_ref / i_meas_at_ref
 
     # Inject two artificial outliers
-    ratios_with_outliers = ratios.copy()
-    ratios_with_outliers[1] = K_TRUE * 3.5    # outlier high
-    ratios_with_outliers[13] = K_TRUE * 0.3    # outlier low
+    ratios[1] = k_true * 3.5    # outlier high
+    ratios[13] = k_true * 0.3    # outlier low
 
     # MAD outlier rejection
-    r_med = np.median(ratios_with_outliers)
-    r_mad = np.median(np.abs(ratios_with_outliers - r_med))
+    r_med = np.median(ratios)
+    r_mad = np.median(np.abs(ratios - r_med))
     robust_sigma = 1.4826 * r_mad
-    inlier_mask = np.abs(ratios_with_outliers - r_med) <= 3.0 * robust_sigma
-    k_robust = np.median(ratios_with_outliers[inlier_mask])
+    inlier_mask = np.abs(ratios - r_med) <= 3.0 * robust_sigma
+    k_robust = np.median(ratios[inlier_mask])
+    return q_dense, i_meas_dense, ratios, inlier_mask, r_med, robust_sigma, k_robust
+
+
+def make_kfactor_figure():
+    K_TRUE = 0.035
+    (
+        q_dense,
+        i_meas_dense,
+        ratios_with_outliers,
+        inlier_mask,
+        r_med,
+        robust_sigma,
+        k_robust,
+    ) = simulate_kfactor(Q_REF, I_REF, K_TRUE, seed=42)
 
     # ── Create figure ──
     fig, axes = plt.subplots(1, 2, figsize=(11, 4.2), gridspec_kw={"wspace": 0.35})
@@ -1,11 +1,17 @@
 """saxsabs: SAXS absolute intensity calibration utilities."""
 
-from .core.normalization import compute_norm_factor, monitor_norm_formula
+from .core.normalization import (
+    compute_norm_factor,
+    compute_norm_factor_batch,
+    get_norm_factor_fn,
+    monitor_norm_formula,
+)
 from .core.calibration import KFactorEstimationResult, estimate_k_factor_robust
 from .core.mu_calculator import (
     XRAYDB_VERSION,
     MuResult,
     calculate_mu,
+    calculate_mu_from_preset,
     mu_rho_single,
     parse_composition_string,
 )
@@ -26,7 +32,7 @@ from .core.intensity_state import (
     require_absolute_input_for_buffer_subtraction,
     require_relative_input_for_absolute_scaling,
 )
-from .core.buffer_subtraction import BufferSubtractionResult, subtract_buffer
+from .core.buffer_subtraction import BufferSubtractionResult, subtract_buffer, subtract_buffer_batch
 from .core.preflight import evaluate_preflight_gate, PreflightGateSummary
 from .core.execution_policy import (
     RunPolicy,
@@ -54,6 +60,7 @@ from .core.calibration_context import CalibrationContext, sha256_file
 from .core.uncertainty import AbsoluteUncertaintyBudget, propagate_absolute_uncertainty
 from .io.parsers import (
     parse_header_values,
+    parse_header_values_batch,
     parse_header_values_with_meta,
     read_external_1d_profile,
     extract_acquisition_timestamp,
@@ -68,6 +75,8 @@ from .io.calibrated2d import (
 )
 from .constants import (
     NIST_SRM3600_DATA,
+    NIST_SRM3600_I,
+    NIST_SRM3600_Q,
     NIST_SRM3600_UNCERTAINTY,
     NIST_SRM3600_COVERAGE_FACTOR,
     STANDARD_REGISTRY,
@@ -82,12 +91,16 @@ __all__ = [
     "__version__",
     # normalization
     "compute_norm_factor",
+    "compute_norm_factor_batch",
+    "get_norm_factor_fn",
     "monitor_norm_formula",
     # calibration
     "KFactorEstimationResult",
     "estimate_k_factor_robust",
     # standards
     "NIST_SRM3600_DATA",
+    "NIST_SRM3600_Q",
+    "NIST_SRM3600_I",
     "NIST_SRM3600_UNCERTAINTY",
     "NIST_SRM3600_COVERAGE_FACTOR",
     "STANDARD_REGISTRY",
@@ -98,6 +111,7 @@ __all__ = [
     "MuResult",
     "XRAYDB_VERSION",
     "calculate_mu",
+    "calculate_mu_from_preset",
     "mu_rho_single",
     "parse_composition_string",
     "MaterialAttenuationResult",
@@ -117,8 +131,10 @@ __all__ = [
     # buffer subtraction
     "BufferSubtractionResult",
     "subtract_buffer",
+    "subtract_buffer_batch",
     # I/O
     "parse_header_values",
+    "parse_header_values_batch",
     "parse_header_values_with_meta",
     "read_external_1d_profile",
     "extract_acquisition_timestamp",
@@ -25,6 +25,16 @@ def _die(message: str) -> None:
     raise SystemExit(1)
 
 
+def _q_bound(text: str) -> float:
+    try:
+        value = float(text)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid q value: {text!r}") from exc
+    if not math.isfinite(value) or value < 0:
+        raise argparse.ArgumentTypeError(f"q value must be finite and >= 0: {text!r}")
+    return value
+
+
 def _clean_column_name(name: object) -> str:
     return "".join(ch for ch in str(name).strip().lower() if ch.isalnum())
 
@@ -321,8 +331,8 @@ def build_parser() -> argparse.ArgumentParser:
     p_k.add_argument("--i-col", default=None, help="Measured intensity column override")
     p_k.add_argument("--ref-q-col", default=None, help="Reference q column override")
     p_k.add_argument("--ref-i-col", default=None, help="Reference intensity column override")
-    p_k.add_argument("--qmin", type=float, default=0.01)
-    p_k.add_argument("--qmax", type=float, default=0.2)
+    p_k.add_argument("--qmin", type=_q_bound, default=0.01)
+    p_k.add_argument("--qmax", type=_q_bound, default=0.2)
 
     p_bl = sub.add_parser(
         "bl19b2-abs2d",
@@ -347,7 +357,10 @@ def build_parser() -> argparse.ArgumentParser:
 
 
 def main() -> None:
-    args = build_parser().parse_args()
+    parser = build_parser()
+    args = parser.parse_args()
+    if args.command == "estimate-k" and args.qmin >= args.qmax:
+        parser.error("estimate-k: --qmin must be smaller than --qmax")
     if args.command == "norm-factor":
         out = compute_norm_factor(args.exp, args.mon, args.trans, args.mode)
         if not math.isfinite(out):
@@ -21,6 +21,7 @@ Lupolen (LDPE)
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 import numpy as np
 
@@ -109,7 +110,16 @@ _NIST_SRM3600_CERTIFICATE_TABLE = np.array(
     dtype=np.float64,
 )
 
-NIST_SRM3600_DATA = _NIST_SRM3600_CERTIFICATE_TABLE[:, :2].copy()
+NIST_SRM3600_Q = np.ascontiguousarray(_NIST_SRM3600_CERTIFICATE_TABLE[:, 0])
+"""Contiguous, read-only certified *q* column of :data:`NIST_SRM3600_DATA` (Å⁻¹)."""
+
+NIST_SRM3600_I = np.ascontiguousarray(_NIST_SRM3600_CERTIFICATE_TABLE[:, 1])
+"""Contiguous, read-only certified dΣ/dΩ column of :data:`NIST_SRM3600_DATA` (cm⁻¹)."""
+
+NIST_SRM3600_Q.setflags(write=False)
+NIST_SRM3600_I.setflags(write=False)
+
+NIST_SRM3600_DATA = np.column_stack((NIST_SRM3600_Q, NIST_SRM3600_I))
 """Certified ``[q, dΣ/dΩ]`` values from NIST SRM 3600 Certificate Table 1."""
 
 NIST_SRM3600_UNCERTAINTY = _NIST_SRM3600_CERTIFICATE_TABLE[:, 2:].copy()
@@ -231,8 +241,8 @@ STANDARD_REGISTRY: dict[str, StandardReference] = {
     "SRM3600": StandardReference(
         name="NIST SRM 3600 (Glassy Carbon)",
         standard_type="primary",
-        q_data=NIST_SRM3600_DATA[:, 0].copy(),
-        i_data=NIST_SRM3600_DATA[:, 1].copy(),
+        q_data=NIST_SRM3600_Q,
+        i_data=NIST_SRM3600_I,
         standard_uncertainty_data=NIST_SRM3600_UNCERTAINTY[:, 0].copy(),
         expanded_uncertainty_data=NIST_SRM3600_UNCERTAINTY[:, 1].copy(),
         coverage_factor=NIST_SRM3600_COVERAGE_FACTOR,
@@ -275,6 +285,17 @@ STANDARD_REGISTRY: dict[str, StandardReference] = {
 }
 
 
+@lru_cache(maxsize=32)
+def _flat_water_reference(
+    temperature_C: float, q_min: float, q_max: float, n_points: int
+) -> tuple[np.ndarray, np.ndarray]:
+    q_arr = np.linspace(q_min, q_max, n_points)
+    i_arr = np.full_like(q_arr, water_dsdw(temperature_C))
+    q_arr.setflags(write=False)
+    i_arr.setflags(write=False)
+    return q_arr, i_arr
+
+
 def get_reference_data(
     standard_key: str,
     temperature_C: float | None = None,
@@ -301,7 +322,8 @@ def get_reference_data(
     Returns
     -------
     tuple[ndarray, ndarray]
-        ``(q_ref, i_ref)`` both 1-D float64.
+        ``(q_ref, i_ref)`` both 1-D float64.  Built-in curves are shared,
+        read-only arrays; copy them before modifying in place.
 
     Raises
     ------
@@ -315,7 +337,7 @@ def get_reference_data(
 
     # --- built-in q-I curve (e.g. SRM 3600) --------------------------------
     if std.q_data is not None and std.i_data is not None:
-        return std.q_data.copy(), std.i_data.copy()
+        return std.q_data, std.i_data
 
     # --- flat / q-independent (e.g. water) ----------------------------------
     if std.is_q_independent:
@@ -325,11 +347,13 @@ def get_reference_data(
         n_points = int(n_points)
         if n_points < 2:
             raise ValueError("n_points must be >= 2")
-        T = temperature_C if temperature_C is not None else _WATER_REF_TEMP_C
-        dsdw = water_dsdw(T)
-        q_arr = np.linspace(q_min, q_max, n_points)
-        i_arr = np.full_like(q_arr, dsdw)
-        return q_arr, i_arr
+        if temperature_C is None:
+            temperature_C = _WATER_REF_TEMP_C
+        try:
+            temperature_C = float(temperature_C)
+        except (TypeError, ValueError) as exc:
+            raise ValueError("Water temperature must be a finite number") from exc
+        return _flat_water_reference(temperature_C, q_min, q_max, n_points)
 
     # --- user-provided (Lupolen / Custom) -----------------------------------
     if q_user is not None and i_user is not None:
@@ -1,9 +1,15 @@
-from .normalization import compute_norm_factor, monitor_norm_formula
+from .normalization import (
+    compute_norm_factor,
+    compute_norm_factor_batch,
+    get_norm_factor_fn,
+    monitor_norm_formula,
+)
 from .calibration import KFactorEstimationResult, estimate_k_factor_robust
 from .mu_calculator import (
     XRAYDB_VERSION,
     MuResult,
     calculate_mu,
+    calculate_mu_from_preset,
     mu_rho_single,
     parse_composition_string,
 )
@@ -41,7 +47,7 @@ from .intensity_state import (
     require_relative_input_for_absolute_scaling,
     serialize_correction_ledger,
 )
-from .buffer_subtraction import BufferSubtractionResult, subtract_buffer
+from .buffer_subtraction import BufferSubtractionResult, subtract_buffer, subtract_buffer_batch
 from .execution_policy import RunPolicy, parse_run_policy, should_skip_all_existing
 from .preflight import PreflightGateSummary, evaluate_preflight_gate
 from .reference_matching import (
@@ -72,12 +78,15 @@ from .uncertainty import AbsoluteUncertaintyBudget, propagate_absolute_uncertain
 
 __all__ = [
     "compute_norm_factor",
+    "compute_norm_factor_batch",
+    "get_norm_factor_fn",
     "monitor_norm_formula",
     "KFactorEstimationResult",
     "estimate_k_factor_robust",
     "MuResult",
     "XRAYDB_VERSION",
     "calculate_mu",
+    "calculate_mu_from_preset",
     "mu_rho_single",
     "parse_composition_string",
     "AttenuationTable",
@@ -112,6 +121,7 @@ __all__ = [
     "serialize_correction_ledger",
     "BufferSubtractionResult",
     "subtract_buffer",
+    "subtract_buffer_batch",
     "RunPolicy",
     "parse_run_policy",
     "should_skip_all_existing",
@@ -66,53 +66,14 @@ def _as_1d_float_array(name: str, values: np.ndarray | None, *, require_finite:
     return arr
 
 
-def _prepare_source_grid(
+def _prepare_buffer_grid(
     q_source: np.ndarray,
     y_source: np.ndarray,
-    *,
-    label: str,
-) -> tuple[np.ndarray, np.ndarray]:
-    order = np.argsort(q_source)
-    q_sorted = q_source[order]
-    y_sorted = y_source[order]
-    uq, inv = np.unique(q_sorted, return_inverse=True)
-    if uq.size < 2:
-        raise ValueError(f"{label} q grid must contain at least 2 unique points")
-    if uq.size != q_sorted.size:
-        y_sum = np.zeros_like(uq, dtype=np.float64)
-        counts = np.zeros_like(uq, dtype=np.float64)
-        for idx, group in enumerate(inv):
-            y_sum[group] += y_sorted[idx]
-            counts[group] += 1.0
-        y_sorted = y_sum / np.clip(counts, 1.0, None)
-        q_sorted = uq
-    return q_sorted, y_sorted
-
-
-def _interpolate_on_grid(
-    q_target: np.ndarray,
-    q_source: np.ndarray,
-    y_source: np.ndarray,
-    *,
-    label: str,
-) -> np.ndarray:
-    q_src, y_src = _prepare_source_grid(q_source, y_source, label=label)
-    tol = max(1e-12, 1e-9 * max(abs(q_src[0]), abs(q_src[-1]), abs(q_target).max(initial=0.0)))
-    if np.min(q_target) < q_src[0] - tol or np.max(q_target) > q_src[-1] + tol:
-        raise ValueError(
-            f"sample q grid extends outside {label} q range "
-            f"({q_src[0]:.6g} to {q_src[-1]:.6g})"
-        )
-    return np.interp(q_target, q_src, y_src)
-
-
-def _prepare_variance_grid(
-    q_source: np.ndarray,
     sigma_source: np.ndarray,
     *,
     label: str,
-) -> tuple[np.ndarray, np.ndarray]:
-    """Return sorted q and variance of an averaged source profile.
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return sorted q, mean intensity and variance of the mean of a source profile.
 
     Duplicate source points are treated as independent observations of their
     mean.  Any unknown input uncertainty keeps the corresponding mean
@@ -120,30 +81,39 @@ def _prepare_variance_grid(
     """
     order = np.argsort(q_source)
     q_sorted = q_source[order]
+    y_sorted = y_source[order]
     variance_sorted = np.square(sigma_source[order])
-    uq, inv = np.unique(q_sorted, return_inverse=True)
+    uq, inv, counts = np.unique(q_sorted, return_inverse=True, return_counts=True)
     if uq.size < 2:
         raise ValueError(f"{label} q grid must contain at least 2 unique points")
     if uq.size == q_sorted.size:
-        return q_sorted, variance_sorted
+        return q_sorted, y_sorted, variance_sorted
 
-    variance_of_mean = np.full(uq.shape, np.nan, dtype=np.float64)
-    for group in range(uq.size):
-        group_variance = variance_sorted[inv == group]
-        if np.all(np.isfinite(group_variance)):
-            variance_of_mean[group] = float(group_variance.sum() / group_variance.size**2)
-    return uq, variance_of_mean
+    # NaN variances propagate through the group sums, keeping those means unknown.
+    y_mean = np.bincount(inv, weights=y_sorted, minlength=uq.size) / counts
+    variance_of_mean = (
+        np.bincount(inv, weights=variance_sorted, minlength=uq.size) / np.square(counts)
+    )
+    return uq, y_mean, variance_of_mean
 
 
-def _interpolate_variance_on_grid(
+def _interpolate_buffer_on_grid(
     q_target: np.ndarray,
     q_source: np.ndarray,
+    y_source: np.ndarray,
     sigma_source: np.ndarray,
     *,
     label: str,
-) -> np.ndarray:
-    """Propagate independent endpoint variances through linear interpolation."""
-    q_src, variance_src = _prepare_variance_grid(q_source, sigma_source, label=label)
+) -> tuple[np.ndarray, np.ndarray]:
+    """Linearly interpolate intensity and propagate variance in one pass.
+
+    The source grid is sorted and the bracketing indices and weights are
+    computed once, then shared by the intensity and the variance.  Endpoint
+    variances are treated as independent.
+    """
+    q_src, y_src, variance_src = _prepare_buffer_grid(
+        q_source, y_source, sigma_source, label=label
+    )
     tol = max(1e-12, 1e-9 * max(abs(q_src[0]), abs(q_src[-1]), abs(q_target).max(initial=0.0)))
     if np.min(q_target) < q_src[0] - tol or np.max(q_target) > q_src[-1] + tol:
         raise ValueError(
@@ -159,18 +129,105 @@ def _interpolate_variance_on_grid(
     weight_upper = np.clip(weight_upper, 0.0, 1.0)
     weight_lower = 1.0 - weight_upper
 
-    out = np.full(q_target.shape, np.nan, dtype=np.float64)
+    y_lower = y_src[lower]
+    y_upper = y_src[upper]
     exact_lower = np.isclose(weight_upper, 0.0, rtol=0.0, atol=1e-14)
     exact_upper = np.isclose(weight_upper, 1.0, rtol=0.0, atol=1e-14)
+    y_out = y_lower + weight_upper * (y_upper - y_lower)
+    y_out[exact_upper] = y_upper[exact_upper]
+
+    variance_lower = variance_src[lower]
+    variance_upper = variance_src[upper]
+    variance_out = np.full(q_target.shape, np.nan, dtype=np.float64)
     between = ~(exact_lower | exact_upper)
-    out[exact_lower] = variance_src[lower[exact_lower]]
-    out[exact_upper] = variance_src[upper[exact_upper]]
-    known = between & np.isfinite(variance_src[lower]) & np.isfinite(variance_src[upper])
-    out[known] = (
-        np.square(weight_lower[known]) * variance_src[lower[known]]
-        + np.square(weight_upper[known]) * variance_src[upper[known]]
+    variance_out[exact_lower] = variance_lower[exact_lower]
+    variance_out[exact_upper] = variance_upper[exact_upper]
+    known = between & np.isfinite(variance_lower) & np.isfinite(variance_upper)
+    variance_out[known] = (
+        np.square(weight_lower[known]) * variance_lower[known]
+        + np.square(weight_upper[known]) * variance_upper[known]
     )
-    return out
+    return y_out, variance_out
+
+
+def _validate_high_q_window(high_q_diag: tuple[float, float]) -> tuple[float, float]:
+    try:
+        q_lo, q_hi = (float(value) for value in high_q_diag)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("high_q_diag must contain two finite increasing values") from exc
+    if not np.isfinite(q_lo) or not np.isfinite(q_hi) or q_lo >= q_hi:
+        raise ValueError("high_q_diag must contain two finite increasing values")
+    return q_lo, q_hi
+
+
+def _validate_alpha_uncertainty(alpha_uncertainty: float | None) -> float | None:
+    if alpha_uncertainty is None:
+        return None
+    alpha_uncertainty = float(alpha_uncertainty)
+    if not np.isfinite(alpha_uncertainty) or alpha_uncertainty < 0:
+        raise ValueError("alpha_uncertainty must be finite and >= 0")
+    return alpha_uncertainty
+
+
+def _validate_errors(name: str, err: np.ndarray) -> None:
+    if np.any(np.isinf(err)):
+        raise ValueError(f"{name} contains infinite values")
+    if np.any(np.isfinite(err) & (err < 0)):
+        raise ValueError(f"{name} contains negative values")
+
+
+def _validate_profile(
+    q_values: np.ndarray,
+    i_values: np.ndarray,
+    err_values: np.ndarray | None,
+    *,
+    label: str,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    q_arr = _as_1d_float_array(f"q_{label}", q_values)
+    i_arr = _as_1d_float_array(f"i_{label}", i_values)
+    if q_arr.shape != i_arr.shape:
+        raise ValueError(f"q_{label} and i_{label} shape mismatch")
+    e_arr = (
+        _as_1d_float_array(f"err_{label}", err_values, require_finite=False)
+        if err_values is not None
+        else np.full_like(i_arr, np.nan)
+    )
+    if e_arr.shape != i_arr.shape:
+        raise ValueError(f"err_{label} shape mismatch")
+    _validate_errors(f"err_{label}", e_arr)
+    return q_arr, i_arr, e_arr
+
+
+def _buffer_on_sample_grid(
+    q_s: np.ndarray, q_b: np.ndarray, i_b: np.ndarray, e_b: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return buffer intensity and variance on the sample q grid."""
+    if not _is_same_q_grid(q_s, q_b):
+        return _interpolate_buffer_on_grid(q_s, q_b, i_b, e_b, label="buffer")
+    return i_b, np.square(e_b)
+
+
+def _is_same_q_grid(q_s: np.ndarray, q_b: np.ndarray) -> bool:
+    if q_s.shape != q_b.shape:
+        return False
+    # Sample and buffer often share one q array; skip the element-wise compare.
+    if q_s is q_b or (q_s.ctypes.data == q_b.ctypes.data and q_s.strides == q_b.strides):
+        return True
+    return np.allclose(q_s, q_b, rtol=0.0, atol=1e-8)
+
+
+def _high_q_diagnostic(
+    q_s: np.ndarray, i_sub: np.ndarray, q_lo: float, q_hi: float
+) -> tuple[float, bool]:
+    # Index the (usually narrow) window once and reduce over that single copy.
+    idx = np.flatnonzero((q_s >= q_lo) & (q_s <= q_hi))
+    window = i_sub[idx]
+    window = window[np.isfinite(window)]
+    if window.size >= 3:
+        residual_mean = float(window.mean())
+        residual_std = float(np.sqrt(np.mean(np.square(window - residual_mean))))
+        return residual_mean, abs(residual_mean) < 3.0 * max(residual_std, 1e-30)
+    return 0.0, True  # not enough points for diagnostic
 
 
 def validate_alpha(alpha: float) -> None:
@@ -223,81 +280,27 @@ def subtract_buffer(
     BufferSubtractionResult
     """
     validate_alpha(alpha)
-    try:
-        q_lo, q_hi = (float(value) for value in high_q_diag)
-    except (TypeError, ValueError) as exc:
-        raise ValueError("high_q_diag must contain two finite increasing values") from exc
-    if not np.isfinite(q_lo) or not np.isfinite(q_hi) or q_lo >= q_hi:
-        raise ValueError("high_q_diag must contain two finite increasing values")
-
-    if alpha_uncertainty is not None:
-        alpha_uncertainty = float(alpha_uncertainty)
-        if not np.isfinite(alpha_uncertainty) or alpha_uncertainty < 0:
-            raise ValueError("alpha_uncertainty must be finite and >= 0")
-
-    q_s = _as_1d_float_array("q_sample", q_sample)
-    i_s = _as_1d_float_array("i_sample", i_sample)
-    if q_s.shape != i_s.shape:
-        raise ValueError("q_sample and i_sample shape mismatch")
-    e_s = (
-        _as_1d_float_array("err_sample", err_sample, require_finite=False)
-        if err_sample is not None
-        else np.full_like(i_s, np.nan)
-    )
-    if e_s.shape != i_s.shape:
-        raise ValueError("err_sample shape mismatch")
-    if np.any(np.isinf(e_s)):
-        raise ValueError("err_sample contains infinite values")
-    if np.any(np.isfinite(e_s) & (e_s < 0)):
-        raise ValueError("err_sample contains negative values")
-
-    q_b = _as_1d_float_array("q_buffer", q_buffer)
-    i_b = _as_1d_float_array("i_buffer", i_buffer)
-    if q_b.shape != i_b.shape:
-        raise ValueError("q_buffer and i_buffer shape mismatch")
-    e_b = (
-        _as_1d_float_array("err_buffer", err_buffer, require_finite=False)
-        if err_buffer is not None
-        else np.full_like(i_b, np.nan)
-    )
-    if e_b.shape != i_b.shape:
-        raise ValueError("err_buffer shape mismatch")
-    if np.any(np.isinf(e_b)):
-        raise ValueError("err_buffer contains infinite values")
-    if np.any(np.isfinite(e_b) & (e_b < 0)):
-        raise ValueError("err_buffer contains negative values")
+    q_lo, q_hi = _validate_high_q_window(high_q_diag)
+    alpha_uncertainty = _validate_alpha_uncertainty(alpha_uncertainty)
+    q_s, i_s, e_s = _validate_profile(q_sample, i_sample, err_sample, label="sample")
+    q_b, i_b, e_b = _validate_profile(q_buffer, i_buffer, err_buffer, label="buffer")
 
     # Interpolate buffer onto sample q-grid if grids differ
-    if q_s.shape != q_b.shape or not np.allclose(q_s, q_b, rtol=0.0, atol=1e-8):
-        i_b = _interpolate_on_grid(q_s, q_b, i_b, label="buffer")
-        buffer_variance = _interpolate_variance_on_grid(
-            q_s, q_b, e_b, label="buffer uncertainty"
-        )
-    else:
-        buffer_variance = np.square(e_b)
+    i_b, buffer_variance = _buffer_on_sample_grid(q_s, q_b, i_b, e_b)
 
     # Subtraction
     i_sub = i_s - alpha * i_b
 
     # Unknown input errors intentionally yield NaN, never an optimistic partial budget.
-    variance_statistical = np.square(e_s) + alpha**2 * buffer_variance
-    err_statistical = np.sqrt(variance_statistical)
-    variance_sub = variance_statistical.copy()
+    err_statistical = np.square(e_s)
+    err_statistical += alpha**2 * buffer_variance
+    np.sqrt(err_statistical, out=err_statistical)
     if alpha_uncertainty is None:
-        variance_sub = variance_sub + np.full_like(i_b, np.nan)
+        err_sub = np.full_like(i_b, np.nan)
     else:
-        variance_sub = variance_sub + np.square(i_b * alpha_uncertainty)
-    err_sub = np.sqrt(variance_sub)
-
-    # High-q diagnostic
-    mask = (q_s >= q_lo) & (q_s <= q_hi) & np.isfinite(i_sub)
-    if mask.sum() >= 3:
-        residual_mean = float(np.mean(i_sub[mask]))
-        residual_std = float(np.std(i_sub[mask]))
-        check_ok = abs(residual_mean) < 3.0 * max(residual_std, 1e-30)
-    else:
-        residual_mean = 0.0
-        check_ok = True  # not enough points for diagnostic
+        err_sub = np.hypot(err_statistical, i_b * alpha_uncertainty)
+
+    residual_mean, check_ok = _high_q_diagnostic(q_s, i_sub, q_lo, q_hi)
 
     return BufferSubtractionResult(
         q=q_s,
@@ -309,3 +312,114 @@ def subtract_buffer(
         alpha_uncertainty=alpha_uncertainty,
         err_statistical=err_statistical,
     )
+
+
+def subtract_buffer_batch(
+    q_sample: np.ndarray,
+    i_samples: np.ndarray,
+    err_samples: np.ndarray | None,
+    q_buffer: np.ndarray,
+    i_buffer: np.ndarray,
+    err_buffer: np.ndarray | None,
+    alphas: float | np.ndarray = 1.0,
+    high_q_diag: tuple[float, float] = (0.15, 0.25),
+    *,
+    alpha_uncertainty: float | np.ndarray | None = None,
+) -> list[BufferSubtractionResult]:
+    """Subtract one buffer curve from a stack of samples on a shared *q*-grid.
+
+    Equivalent to calling :func:`subtract_buffer` once per row, but the buffer
+    is interpolated onto the sample grid only once and the subtraction and
+    error propagation are evaluated for the whole ``(N, Nq)`` stack at once.
+
+    Parameters
+    ----------
+    q_sample : np.ndarray
+        Common sample *q*-grid, shape ``(Nq,)``.
+    i_samples, err_samples : np.ndarray
+        Sample intensities and errors, shape ``(N, Nq)``.  Missing errors
+        remain unknown (NaN).
+    q_buffer, i_buffer, err_buffer
+        Buffer scattering profile.
+    alphas : float | np.ndarray
+        Buffer scaling factor, either shared or one per sample.
+    alpha_uncertainty : float | np.ndarray | None
+        Standard uncertainty of α, either shared or one per sample.
+    high_q_diag : tuple[float, float]
+        *q* window for the high-*q* residual check.
+
+    Returns
+    -------
+    list[BufferSubtractionResult]
+        One result per sample row.
+    """
+    q_lo, q_hi = _validate_high_q_window(high_q_diag)
+
+    q_s = _as_1d_float_array("q_sample", q_sample)
+    i_s = np.asarray(i_samples, dtype=np.float64)
+    if i_s.ndim != 2:
+        raise ValueError("i_samples must be a 2-D array")
+    if i_s.shape[1] != q_s.size:
+        raise ValueError("q_sample and i_samples shape mismatch")
+    if not np.all(np.isfinite(i_s)):
+        raise ValueError("i_samples contains non-finite values")
+    n_samples = i_s.shape[0]
+    if err_samples is None:
+        e_s = np.full_like(i_s, np.nan)
+    else:
+        e_s = np.asarray(err_samples, dtype=np.float64)
+        if e_s.shape != i_s.shape:
+            raise ValueError("err_samples shape mismatch")
+        _validate_errors("err_samples", e_s)
+
+    try:
+        alpha_arr = np.broadcast_to(np.asarray(alphas, dtype=np.float64), (n_samples,))
+    except ValueError as exc:
+        raise ValueError("alphas must be a scalar or one value per sample") from exc
+    for alpha in alpha_arr:
+        validate_alpha(float(alpha))
+
+    if alpha_uncertainty is None:
+        alpha_u_arr = None
+    else:
+        try:
+            alpha_u_arr = np.broadcast_to(
+                np.asarray(alpha_uncertainty, dtype=np.float64), (n_samples,)
+            )
+        except ValueError as exc:
+            raise ValueError(
+                "alpha_uncertainty must be a scalar or one value per sample"
+            ) from exc
+        if not np.all(np.isfinite(alpha_u_arr)) or np.any(alpha_u_arr < 0):
+            raise ValueError("alpha_uncertainty must be finite and >= 0")
+
+    q_b, i_b, e_b = _validate_profile(q_buffer, i_buffer, err_buffer, label="buffer")
+    i_b, buffer_variance = _buffer_on_sample_grid(q_s, q_b, i_b, e_b)
+
+    alpha_col = alpha_arr[:, None]
+    i_sub = i_s - alpha_col * i_b
+
+    err_statistical = np.square(e_s)
+    err_statistical += np.square(alpha_col) * buffer_variance
+    np.sqrt(err_statistical, out=err_statistical)
+    if alpha_u_arr is None:
+        err_sub = np.full_like(i_sub, np.nan)
+    else:
+        err_sub = np.hypot(err_statistical, i_b * alpha_u_arr[:, None])
+
+    results = []
+    for row in range(n_samples):
+        residual_mean, check_ok = _high_q_diagnostic(q_s, i_sub[row], q_lo, q_hi)
+        results.append(
+            BufferSubtractionResult(
+                q=q_s,
+                i_subtracted=i_sub[row],
+                err_subtracted=err_sub[row],
+                alpha=float(alpha_arr[row]),
+                high_q_residual_mean=residual_mean,
+                high_q_check_passed=check_ok,
+                alpha_uncertainty=None if alpha_u_arr is None else float(alpha_u_arr[row]),
+                err_statistical=err_statistical[row],
+            )
+        )
+    return results
@@ -10,12 +10,15 @@ filtering to produce a robust estimate.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Literal
 
 import numpy as np
 
 from saxsabs.constants import (
     NIST_SRM3600_COVERAGE_FACTOR,
-    NIST_SRM3600_DATA,
+    NIST_SRM3600_I,
+    NIST_SRM3600_Q,
     NIST_SRM3600_UNCERTAINTY,
 )
 
@@ -23,7 +26,7 @@ SRM3600_CERTIFIED_THICKNESS_CM: float = 0.1055
 """Certified SRM 3600 thickness used to normalize a measured standard profile."""
 
 _NIST_PARALLELISM_RELATIVE_TOLERANCE: float = float(
-    np.max(NIST_SRM3600_UNCERTAINTY[:, 1] / NIST_SRM3600_DATA[:, 1])
+    np.max(NIST_SRM3600_UNCERTAINTY[:, 1] / NIST_SRM3600_I)
 )
 """Certificate-derived expanded relative intensity uncertainty used for SRM QC."""
 
@@ -86,7 +89,8 @@ def _regularize_profile(q: np.ndarray, i: np.ndarray, min_points: int = 3) -> tu
         min_points: Minimum number of valid unique points required.
 
     Returns:
-        Tuple ``(q_clean, i_clean)`` of 1-D float64 arrays.
+        Tuple ``(q_clean, i_clean)`` of 1-D float64 arrays.  Clean, sorted
+        float64 input is returned without copying.
 
     Raises:
         ValueError: On shape mismatch or insufficient valid data.
@@ -98,31 +102,130 @@ def _regularize_profile(q: np.ndarray, i: np.ndarray, min_points: int = 3) -> tu
     if q_arr.shape != i_arr.shape:
         raise ValueError("q and intensity shape mismatch")
 
-    mask = np.isfinite(q_arr) & np.isfinite(i_arr)
-    q_arr = q_arr[mask]
-    i_arr = i_arr[mask]
+    # One mask buffer, combined in place; skip the compaction copy when clean.
+    mask = np.isfinite(q_arr)
+    np.logical_and(mask, np.isfinite(i_arr), out=mask)
+    if not mask.all():
+        q_arr = q_arr[mask]
+        i_arr = i_arr[mask]
     if q_arr.size < min_points:
         raise ValueError("insufficient valid points")
 
-    order = np.argsort(q_arr)
-    q_arr = q_arr[order]
-    i_arr = i_arr[order]
+    # Integrator output is normally already strictly increasing; only sort and
+    # deduplicate when it is not.
+    if not np.all(q_arr[1:] > q_arr[:-1]):
+        order = np.argsort(q_arr)
+        q_arr = q_arr[order]
+        i_arr = i_arr[order]
 
-    uq, inv = np.unique(q_arr, return_inverse=True)
-    if uq.size != q_arr.size:
-        i_sum = np.zeros_like(uq, dtype=np.float64)
-        cnt = np.zeros_like(uq, dtype=np.float64)
-        for idx, grp in enumerate(inv):
-            i_sum[grp] += i_arr[idx]
-            cnt[grp] += 1.0
-        i_arr = i_sum / np.clip(cnt, 1.0, None)
-        q_arr = uq
+        if not np.all(q_arr[1:] > q_arr[:-1]):
+            uq, inv, counts = np.unique(q_arr, return_inverse=True, return_counts=True)
+            i_arr = np.bincount(inv, weights=i_arr, minlength=uq.size) / counts
+            q_arr = uq
 
     if q_arr.size < min_points:
         raise ValueError("insufficient unique q points")
     return q_arr, i_arr
 
 
+def _interp_sorted(x: np.ndarray, xp: np.ndarray, fp: np.ndarray) -> np.ndarray:
+    """Linear interpolation on a strictly increasing grid via binary search.
+
+    Matches :func:`numpy.interp`, including clamping to the end values
+    outside ``[xp[0], xp[-1]]``.
+    """
+    idx = np.searchsorted(xp, x, side="right") - 1
+    np.clip(idx, 0, xp.size - 2, out=idx)
+    x_lo = xp[idx]
+    f_lo = fp[idx]
+    t = (x - x_lo) / (xp[idx + 1] - x_lo)
+    np.clip(t, 0.0, 1.0, out=t)
+    return f_lo + t * (fp[idx + 1] - f_lo)
+
+
+def _median_inplace(values: np.ndarray) -> float:
+    """Return the median of *values*, partially reordering them in place.
+
+    Uses :meth:`numpy.ndarray.partition` (linear-time selection) rather than
+    a full sort.  Matches :func:`numpy.median` for finite input.
+    """
+    half = values.size // 2
+    if values.size % 2:
+        values.partition(half)
+        return float(values[half])
+    values.partition((half - 1, half))
+    return float((values[half - 1] + values[half]) / 2.0)
+
+
+def _robust_median_mad(values: np.ndarray) -> tuple[float, float, np.ndarray]:
+    """Median, MAD, and absolute deviations of a finite 1-D sample.
+
+    Args:
+        values: Finite 1-D array; left unmodified.
+
+    Returns:
+        Tuple ``(median, mad, abs_dev)`` where ``abs_dev`` is
+        ``|values - median|`` in the original order, ready for inlier masking.
+    """
+    scratch = values.copy()
+    median = _median_inplace(scratch)
+    abs_dev = np.subtract(values, median)
+    np.abs(abs_dev, out=abs_dev)
+    np.copyto(scratch, abs_dev)
+    return median, _median_inplace(scratch), abs_dev
+
+
+def _prepare_reference_window(
+    q_ref_all: np.ndarray,
+    i_ref_all: np.ndarray,
+    u_ref_all: np.ndarray | None,
+    q_lo: float,
+    q_hi: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+    """Validate a reference curve and return its sorted ``[q_lo, q_hi]`` window."""
+    if q_ref_all.shape != i_ref_all.shape:
+        raise ValueError("reference q/intensity shape mismatch")
+    if q_ref_all.ndim != 1:
+        raise ValueError("reference q and intensity must be 1-D arrays")
+    if not np.all(np.isfinite(q_ref_all)) or np.any(q_ref_all <= 0):
+        raise ValueError("reference q must contain only finite values > 0")
+    if np.unique(q_ref_all).size != q_ref_all.size:
+        raise ValueError("reference q values must be unique")
+    if not np.all(np.isfinite(i_ref_all)) or np.any(i_ref_all <= 0):
+        raise ValueError("reference intensity must be finite and > 0")
+    if u_ref_all is not None:
+        if u_ref_all.shape != i_ref_all.shape:
+            raise ValueError("reference intensity/uncertainty shape mismatch")
+        if not np.all(np.isfinite(u_ref_all)) or np.any(u_ref_all < 0):
+            raise ValueError("reference standard uncertainty must be finite and non-negative")
+
+    reference_order = np.argsort(q_ref_all)
+    q_ref_all = q_ref_all[reference_order]
+    win = (q_ref_all >= q_lo) & (q_ref_all <= q_hi)
+    q_ref_all = q_ref_all[win]
+    i_ref_all = i_ref_all[reference_order][win]
+    if u_ref_all is not None:
+        u_ref_all = u_ref_all[reference_order][win]
+    return q_ref_all, i_ref_all, u_ref_all
+
+
+@lru_cache(maxsize=8)
+def _builtin_reference_window(
+    q_lo: float, q_hi: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+    """Return the read-only SRM 3600 window with certificate uncertainties."""
+    window = _prepare_reference_window(
+        NIST_SRM3600_Q,
+        NIST_SRM3600_I,
+        NIST_SRM3600_UNCERTAINTY[:, 0],
+        q_lo,
+        q_hi,
+    )
+    for arr in window:
+        arr.setflags(write=False)
+    return window
+
+
 def estimate_k_factor_robust(
     q_meas: np.ndarray,
     i_meas_per_cm: np.ndarray,
@@ -136,6 +239,7 @@ def estimate_k_factor_robust(
     coverage_factor: float | None = None,
     standard_thickness_cm: float | None = None,
     parallelism_relative_tolerance: float | None = None,
+    precision: Literal["f32", "f64"] = "f64",
 ) -> KFactorEstimationResult:
     """Estimate the absolute-intensity K-factor from measured and reference curves.
 
@@ -163,6 +267,11 @@ coverage_factor: Explicit system factor for reporting expanded K uncertainty.
         parallelism_relative_tolerance: Maximum relative ratio deviation.
             Built-in SRM 3600 uses its certificate-derived 6.25% expanded
             relative intensity uncertainty and permits only stricter overrides.
+        precision: ``"f64"`` (default) or ``"f32"``.  Single precision is used
+            only for the ratio computation and MAD filtering, which is adequate
+            for plotting and QC previews; keep the default when the K-factor is
+            applied as the absolute-scale multiplier.  Intensities outside
+            the normal float32 range are rejected in ``"f32"`` mode.
 
     Returns:
         A :class:`KFactorEstimationResult` containing the K-factor and
@@ -199,13 +308,6 @@ coverage_factor: Explicit system factor for reporting expanded K uncertainty.
         NIST_SRM3600_COVERAGE_FACTOR if using_builtin_nist else None
     )
     if using_builtin_nist:
-        q_ref_all = NIST_SRM3600_DATA[:, 0].copy()
-        i_ref_all = NIST_SRM3600_DATA[:, 1].copy()
-        if i_ref_standard_uncertainty is None:
-            u_ref_all: np.ndarray | None = NIST_SRM3600_UNCERTAINTY[:, 0].copy()
-        else:
-            u_ref_all = np.asarray(i_ref_standard_uncertainty, dtype=np.float64)
-
         effective_standard_thickness_cm = (
             SRM3600_CERTIFIED_THICKNESS_CM
             if standard_thickness_cm is None
@@ -234,13 +336,6 @@ coverage_factor: Explicit system factor for reporting expanded K uncertainty.
                     f"the certificate-derived {_NIST_PARALLELISM_RELATIVE_TOLERANCE:.7g}"
                 )
     else:
-        q_ref_all = np.asarray(q_ref, dtype=np.float64)
-        i_ref_all = np.asarray(i_ref, dtype=np.float64)
-        u_ref_all = (
-            None
-            if i_ref_standard_uncertainty is None
-            else np.asarray(i_ref_standard_uncertainty, dtype=np.float64)
-        )
         effective_standard_thickness_cm = (
             None if standard_thickness_cm is None else float(standard_thickness_cm)
         )
@@ -260,37 +355,34 @@ coverage_factor: Explicit system factor for reporting expanded K uncertainty.
     ):
         raise ValueError("parallelism_relative_tolerance must be finite and >= 0")
 
-    if q_ref_all.shape != i_ref_all.shape:
-        raise ValueError("reference q/intensity shape mismatch")
-    if q_ref_all.ndim != 1:
-        raise ValueError("reference q and intensity must be 1-D arrays")
-    if not np.all(np.isfinite(q_ref_all)) or np.any(q_ref_all <= 0):
-        raise ValueError("reference q must contain only finite values > 0")
-    if np.unique(q_ref_all).size != q_ref_all.size:
-        raise ValueError("reference q values must be unique")
-    if not np.all(np.isfinite(i_ref_all)) or np.any(i_ref_all <= 0):
-        raise ValueError("reference intensity must be finite and > 0")
-    if u_ref_all is not None:
-        if u_ref_all.shape != i_ref_all.shape:
-            raise ValueError("reference intensity/uncertainty shape mismatch")
-        if not np.all(np.isfinite(u_ref_all)) or np.any(u_ref_all < 0):
-            raise ValueError("reference standard uncertainty must be finite and non-negative")
+    if precision not in ("f32", "f64"):
+        raise ValueError("precision must be 'f32' or 'f64'")
 
-    reference_order = np.argsort(q_ref_all)
-    q_ref_all = q_ref_all[reference_order]
-    i_ref_all = i_ref_all[reference_order]
-    if u_ref_all is not None:
-        u_ref_all = u_ref_all[reference_order]
     if coverage_factor is not None:
         coverage_factor = float(coverage_factor)
         if not np.isfinite(coverage_factor) or coverage_factor <= 0:
             raise ValueError("coverage_factor must be finite and > 0")
 
-    win = (q_ref_all >= q_lo) & (q_ref_all <= q_hi)
-    q_ref_all = q_ref_all[win]
-    i_ref_all = i_ref_all[win]
-    if u_ref_all is not None:
-        u_ref_all = u_ref_all[win]
+    if using_builtin_nist and i_ref_standard_uncertainty is None:
+        q_ref_all, i_ref_all, u_ref_all = _builtin_reference_window(q_lo, q_hi)
+    else:
+        if using_builtin_nist:
+            q_ref_all = NIST_SRM3600_Q
+            i_ref_all = NIST_SRM3600_I
+        else:
+            q_ref_all = np.asarray(q_ref, dtype=np.float64)
+            i_ref_all = np.asarray(i_ref, dtype=np.float64)
+        q_ref_all, i_ref_all, u_ref_all = _prepare_reference_window(
+            q_ref_all,
+            i_ref_all,
+            (
+                None
+                if i_ref_standard_uncertainty is None
+                else np.asarray(i_ref_standard_uncertainty, dtype=np.float64)
+            ),
+            q_lo,
+            q_hi,
+        )
     if q_ref_all.size < min_points:
         raise ValueError("reference points in q window are insufficient")
 
@@ -303,35 +395,60 @@ coverage_factor: Explicit system factor for reporting expanded K uncertainty.
     if q_ref_used.size < min_points:
         raise ValueError("q overlap with reference is insufficient")
 
-    i_meas_interp = np.interp(q_ref_used, q_m, i_m)
-    valid = np.isfinite(i_meas_interp) & (i_meas_interp > positive_floor)
-    if int(valid.sum()) < min_points:
+    i_meas_interp = _interp_sorted(q_ref_used, q_m, i_m)
+    # NaN fails both comparisons, so one fused mask replaces isfinite + floor.
+    valid_idx = np.flatnonzero(
+        (i_meas_interp > positive_floor) & (i_meas_interp < np.inf)
+    )
+    if valid_idx.size < min_points:
         raise ValueError("measured signal too weak or non-positive in overlap region")
 
-    measured_valid = i_meas_interp[valid]
+    # Gather each stream once and divide in place instead of chaining masks.
+    measured_valid = i_meas_interp.take(valid_idx)
+    ratios = i_ref_used.take(valid_idx)
+    if precision == "f32":
+        f32 = np.finfo(np.float32)
+        for values in (measured_valid, ratios):
+            if values.min() < f32.tiny or values.max() > f32.max:
+                raise ValueError(
+                    "intensities exceed the single-precision range; use precision='f64'"
+                )
+        measured_valid = measured_valid.astype(np.float32)
+        ratios = ratios.astype(np.float32)
     with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
-        ratios_all = i_ref_used[valid] / measured_valid
-    if not np.all(np.isfinite(ratios_all)):
+        np.divide(ratios, measured_valid, out=ratios)
+    if not np.all(np.isfinite(ratios)):
         raise ValueError("derived K ratios must be finite")
-    ratio_valid = ratios_all > 0
-    ratios = ratios_all[ratio_valid]
+    # Both operands are positive normal numbers in the working dtype, so only
+    # underflow of the quotient can produce a zero ratio.
+    ratio_valid = None
+    if ratios.min() <= 0:
+        ratio_valid = ratios > 0
+        ratios = ratios[ratio_valid]
     reference_ratio_uncertainty = None
     if u_ref_used is not None:
+        reference_ratio_uncertainty = u_ref_used.take(valid_idx)
         with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
-            reference_ratio_uncertainty = (
-                u_ref_used[valid][ratio_valid] / measured_valid[ratio_valid]
+            np.divide(
+                reference_ratio_uncertainty,
+                measured_valid,
+                out=reference_ratio_uncertainty,
             )
+        if ratio_valid is not None:
+            reference_ratio_uncertainty = reference_ratio_uncertainty[ratio_valid]
         if not np.all(np.isfinite(reference_ratio_uncertainty)):
             raise ValueError("derived reference ratio uncertainty must be finite")
     if ratios.size < min_points:
         raise ValueError("insufficient valid ratio points for robust K estimation")
 
+    # Ratios are finite here, so partition-based selection replaces nanmedian.
+    r_med, r_mad, abs_dev = _robust_median_mad(ratios)
+
     parallelism_max_relative_deviation: float | None = None
     parallelism_check_passed: bool | None = None
     if parallelism_tolerance is not None:
-        ratio_center = float(np.median(ratios))
         with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
-            relative_deviation = np.abs(ratios / ratio_center - 1.0)
+            relative_deviation = abs_dev / r_med
         if not np.all(np.isfinite(relative_deviation)):
             raise ValueError("derived parallelism deviation must be finite")
         parallelism_max_relative_deviation = float(np.max(relative_deviation))
@@ -347,8 +464,6 @@ coverage_factor: Explicit system factor for reporting expanded K uncertainty.
                 f"tolerance={parallelism_tolerance:.7g}"
             )
 
-    r_med = float(np.nanmedian(ratios))
-    r_mad = float(np.nanmedian(np.abs(ratios - r_med)))
     ratios_used = ratios
     if np.isfinite(r_mad):
         if r_mad > 0:
@@ -356,9 +471,11 @@ coverage_factor: Explicit system factor for reporting expanded K uncertainty.
         else:
             # A majority of identical ratios gives MAD=0.  Retain the median
             # cluster instead of silently treating arbitrarily large deviations
-            # as inliers.
-            tolerance = 1e-12 * max(1.0, abs(r_med))
-        inlier = np.abs(ratios - r_med) <= tolerance
+            # as inliers.  The floor follows the working precision so that
+            # single-precision rounding does not split that cluster.
+            relative_floor = max(1e-12, 4.0 * float(np.finfo(ratios.dtype).eps))
+            tolerance = relative_floor * max(1.0, abs(r_med))
+        inlier = abs_dev <= tolerance
         if int(inlier.sum()) < min_points:
             raise ValueError("insufficient inlier ratio points after MAD filtering")
         ratios_used = ratios[inlier]
@@ -366,8 +483,8 @@ coverage_factor: Explicit system factor for reporting expanded K uncertainty.
             reference_ratio_uncertainty = reference_ratio_uncertainty[inlier]
 
     with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
-        k_val = float(np.nanmedian(ratios_used))
-        k_std = float(np.nanstd(ratios_used))
+        k_val = _median_inplace(ratios_used.copy())
+        k_std = float(np.std(ratios_used))
         # The estimator is a median, whose normal-approximation standard error is
         # sqrt(pi/2) times the standard error of a mean from the same distribution.
         k_statistical_u = float(
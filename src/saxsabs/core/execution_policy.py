@@ -9,6 +9,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
+
 
 @dataclass(frozen=True)
 class RunPolicy:
@@ -53,11 +55,21 @@ def parse_run_policy(resume_enabled: bool, overwrite_existing: bool) -> RunPolic
     )
 
 
-def should_skip_all_existing(existing_flags: list[bool], policy: RunPolicy) -> bool:
-    """Return ``True`` when all expected outputs already exist and should skip."""
+def should_skip_all_existing(
+    existing_flags: list[bool] | np.ndarray, policy: RunPolicy
+) -> bool:
+    """Return ``True`` when all expected outputs already exist and should skip.
+
+    The policy part of the decision is resolved once, leaving a single
+    reduction over the flags; a boolean array is reduced by NumPy.
+    """
+    if not policy.resume_enabled or policy.overwrite_existing:
+        return False
+    if isinstance(existing_flags, np.ndarray):
+        return existing_flags.size > 0 and bool(existing_flags.all())
     if not existing_flags:
         return False
-    return all(policy.should_skip_existing(flag) for flag in existing_flags)
+    return all(existing_flags)
 
 
 def resolve_output_path_for_write(path: str | Path, policy: RunPolicy) -> Path:
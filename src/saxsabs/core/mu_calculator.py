@@ -14,6 +14,7 @@ from __future__ import annotations
 import math
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 try:
     import xraydb
@@ -65,8 +66,12 @@ def _validate_composition_fractions(composition: dict[str, float]) -> dict[str,
         if frac < 0:
             raise ValueError(f"Weight fraction for {elem!r} cannot be negative")
         validated[elem] = frac
+    return _normalize_composition_scale(validated)
 
-    total = math.fsum(validated.values())
+
+def _normalize_composition_scale(composition: dict[str, float]) -> dict[str, float]:
+    """Normalize already-validated finite, non-negative values to unit sum."""
+    total = math.fsum(composition.values())
     is_fraction_scale = _sum_is_within(
         total,
         1.0,
@@ -78,7 +83,7 @@ def _validate_composition_fractions(composition: dict[str, float]) -> dict[str,
         _COMPOSITION_PERCENT_SUM_TOLERANCE,
     )
     if is_fraction_scale or is_percent_scale:
-        items = list(validated.items())
+        items = list(composition.items())
         normalized = {
             elem: value / total
             for elem, value in items[:-1]
@@ -161,10 +166,26 @@ MATERIAL_PRESETS: dict[str, tuple[str, dict[str, float], float]] = {
     ),
 }
 
+# Presets as pre-normalized (elements, weight_fractions) tuples, so the preset
+# path iterates plain tuples instead of re-validating a dict on every call.
+_PRESET_FRACTIONS: dict[str, tuple[tuple[str, ...], tuple[float, ...]]] = {
+    key: (tuple(fractions), tuple(fractions.values()))
+    for key, fractions in (
+        (key, _validate_composition_fractions(composition))
+        for key, (_name, composition, _density) in MATERIAL_PRESETS.items()
+    )
+}
+
 
 # ---------------------------------------------------------------------------
 # Core functions
 # ---------------------------------------------------------------------------
+@lru_cache(maxsize=4096)
+def _mu_elam_cached(element: str, energy_eV: float) -> float:
+    """Memoized Elam μ/ρ lookup; batch runs repeat the same (element, energy)."""
+    return float(xraydb.mu_elam(element, energy_eV))
+
+
 def mu_rho_single(element: str, energy_keV: float) -> float:
     """Return mass attenuation coefficient μ/ρ (cm²/g) for one element.
 
@@ -182,7 +203,7 @@ def mu_rho_single(element: str, energy_keV: float) -> float:
     """
     energy_keV = _coerce_positive_finite_scalar("Energy", energy_keV)
     energy_eV = energy_keV * 1000.0
-    return float(xraydb.mu_elam(element, energy_eV))
+    return _mu_elam_cached(element, energy_eV)
 
 
 def calculate_mu(
@@ -220,12 +241,63 @@ def calculate_mu(
     density_g_cm3 = _coerce_positive_finite_scalar("Density", density_g_cm3)
     composition = _validate_composition_fractions(composition)
 
+    return _mix_mu(
+        tuple(composition), tuple(composition.values()), density_g_cm3, energy_keV
+    )
+
+
+def calculate_mu_from_preset(
+    key: str,
+    energy_keV: float,
+    *,
+    density_g_cm3: float | None = None,
+) -> MuResult:
+    """Calculate μ for a :data:`MATERIAL_PRESETS` entry.
+
+    Equivalent to :func:`calculate_mu` on the preset composition, but uses
+    composition fractions normalized once at import.
+
+    Parameters
+    ----------
+    key : str
+        Preset key, e.g. ``"SS304"``.
+    energy_keV : float
+        Photon energy (keV).  Must be > 0.
+    density_g_cm3 : float | None
+        Override for the preset bulk density (g/cm³).
+
+    Returns
+    -------
+    MuResult
+
+    Raises
+    ------
+    ValueError
+        On an unknown preset key or invalid energy/density.
+    """
+    try:
+        elements, weights = _PRESET_FRACTIONS[key]
+    except KeyError:
+        raise ValueError(f"Unknown material preset: {key!r}") from None
+    if density_g_cm3 is None:
+        density_g_cm3 = MATERIAL_PRESETS[key][2]
+    energy_keV = _coerce_positive_finite_scalar("Energy", energy_keV)
+    density_g_cm3 = _coerce_positive_finite_scalar("Density", density_g_cm3)
+    return _mix_mu(elements, weights, density_g_cm3, energy_keV)
+
+
+def _mix_mu(
+    elements: tuple[str, ...],
+    weights: tuple[float, ...],
+    density_g_cm3: float,
+    energy_keV: float,
+) -> MuResult:
     energy_eV = energy_keV * 1000.0
     contributions: dict[str, float] = {}
     mu_rho_mix = 0.0
 
-    for elem, w_i in composition.items():
-        mu_rho_i = float(xraydb.mu_elam(elem, energy_eV))
+    for elem, w_i in zip(elements, weights):
+        mu_rho_i = _mu_elam_cached(elem, energy_eV)
         contrib = w_i * mu_rho_i
         contributions[elem] = contrib
         mu_rho_mix += contrib
@@ -235,7 +307,7 @@ def calculate_mu(
     return MuResult(
         mu_rho_cm2_g=mu_rho_mix,
         mu_linear_cm_inv=mu_linear,
-        composition=dict(composition),
+        composition=dict(zip(elements, weights)),
         density_g_cm3=density_g_cm3,
         energy_keV=energy_keV,
         element_contributions=contributions,
@@ -282,4 +354,5 @@ def parse_composition_string(text: str) -> dict[str, float]:
             raise ValueError(f"Negative value for element {elem}: {val}")
         comp[elem] = value
 
-    return _validate_composition_fractions(comp)
+    # Values were checked above; skip the per-element re-validation pass.
+    return _normalize_composition_scale(comp)
@@ -12,9 +12,23 @@ Two normalization modes are supported:
 from __future__ import annotations
 
 import math
+from collections.abc import Callable
 
+import numpy as np
 
-MONITOR_NORM_MODES = ("rate", "integrated")
+RATE = "rate"
+INTEGRATED = "integrated"
+MONITOR_NORM_MODES = (RATE, INTEGRATED)
+
+
+def _resolve_mode(mode: str) -> str:
+    """Return the canonical spelling of *mode* or raise ``ValueError``."""
+    if isinstance(mode, str) and mode in MONITOR_NORM_MODES:
+        return mode
+    mode_n = str(mode).strip().lower()
+    if mode_n not in MONITOR_NORM_MODES:
+        raise ValueError(f"Unknown I0 normalization mode: {mode}")
+    return mode_n
 
 
 def monitor_norm_formula(mode: str) -> str:
@@ -29,12 +43,20 @@ def monitor_norm_formula(mode: str) -> str:
     Raises:
         ValueError: If *mode* is not recognized.
     """
-    mode_n = str(mode).strip().lower()
-    if mode_n == "rate":
+    if _resolve_mode(mode) == RATE:
         return "exp * I0 * T"
-    if mode_n == "integrated":
-        return "I0 * T"
-    raise ValueError(f"Unknown I0 normalization mode: {mode}")
+    return "I0 * T"
+
+
+def _as_float_or_nan(value: object) -> float:
+    if type(value) is float:
+        return value
+    if value is None:
+        return math.nan
+    try:
+        return float(value)
+    except Exception:
+        return math.nan
 
 
 def compute_norm_factor(exp: float | None, mon: float | None, trans: float | None, mode: str) -> float:
@@ -54,33 +76,87 @@ def compute_norm_factor(exp: float | None, mon: float | None, trans: float | Non
     Raises:
         ValueError: If *mode* is not recognized.
     """
-    mode_n = str(mode).strip().lower()
-    if mode_n not in MONITOR_NORM_MODES:
-        raise ValueError(f"Unknown I0 normalization mode: {mode}")
+    return get_norm_factor_fn(mode)(exp, mon, trans)
 
-    if mon is None or trans is None:
-        return math.nan
-    try:
-        mon_v = float(mon)
-        trans_v = float(trans)
-    except Exception:
+
+def _norm_factor_integrated(exp: float | None, mon: float | None, trans: float | None) -> float:
+    mon_v = _as_float_or_nan(mon)
+    trans_v = _as_float_or_nan(trans)
+    # Chained comparisons are False for NaN, so they also reject missing values.
+    if not (0.0 < mon_v < math.inf and 0.0 < trans_v <= 1.0):
         return math.nan
+    return mon_v * trans_v
 
-    if not (math.isfinite(mon_v) and math.isfinite(trans_v)):
+
+def _norm_factor_rate(exp: float | None, mon: float | None, trans: float | None) -> float:
+    base = _norm_factor_integrated(None, mon, trans)
+    if math.isnan(base):
         return math.nan
-    if mon_v <= 0 or trans_v <= 0 or trans_v > 1.0:
+    exp_v = _as_float_or_nan(exp)
+    if not 0.0 < exp_v < math.inf:
         return math.nan
+    return exp_v * base
+
 
-    if mode_n == "rate":
-        if exp is None:
-            return math.nan
-        try:
-            exp_v = float(exp)
-        except Exception:
-            return math.nan
-        if not math.isfinite(exp_v) or exp_v <= 0:
-            return math.nan
-        return exp_v * mon_v * trans_v
-
-    if mode_n == "integrated":
-        return mon_v * trans_v
+_NORM_FACTOR_FNS: dict[str, Callable[[float | None, float | None, float | None], float]] = {
+    RATE: _norm_factor_rate,
+    INTEGRATED: _norm_factor_integrated,
+}
+
+
+def get_norm_factor_fn(
+    mode: str,
+) -> Callable[[float | None, float | None, float | None], float]:
+    """Resolve *mode* once and return the matching ``fn(exp, mon, trans)``.
+
+    Batch drivers with a fixed mode can call this outside their frame loop to
+    avoid re-normalizing the mode string per frame.  The returned function
+    follows the same rules as :func:`compute_norm_factor`.
+
+    Raises:
+        ValueError: If *mode* is not recognized.
+    """
+    return _NORM_FACTOR_FNS[_resolve_mode(mode)]
+
+
+def compute_norm_factor_batch(
+    exp: np.ndarray | None,
+    mon: np.ndarray,
+    trans: np.ndarray,
+    mode: str,
+) -> np.ndarray:
+    """Vectorized :func:`compute_norm_factor` for many frames at once.
+
+    Args:
+        exp: Exposure times in seconds.  Required when *mode* is ``'rate'``;
+            ignored for ``'integrated'``.
+        mon: Beam-monitor counts (I₀).
+        trans: Sample transmission factors (0 < T ≤ 1).
+        mode: ``'rate'`` or ``'integrated'``.
+
+    Missing values should be encoded as NaN.  Inputs are broadcast together.
+
+    Returns:
+        A float64 array of normalization products, NaN where the frame's
+        inputs are missing, non-positive, or non-finite (same rules as
+        :func:`compute_norm_factor`).
+
+    Raises:
+        ValueError: If *mode* is not recognized, or *exp* is missing in
+            ``'rate'`` mode.
+    """
+    is_rate = _resolve_mode(mode) == RATE
+    if is_rate and exp is None:
+        raise ValueError("exp is required for 'rate' normalization")
+
+    mon_v = np.asarray(mon, dtype=np.float64)
+    trans_v = np.asarray(trans, dtype=np.float64)
+    with np.errstate(invalid="ignore", over="ignore"):
+        # NaN compares False, so the range checks also reject missing values.
+        valid = (mon_v > 0) & (trans_v > 0) & (trans_v <= 1.0) & np.isfinite(mon_v)
+        out = mon_v * trans_v
+        if is_rate:
+            exp_v = np.asarray(exp, dtype=np.float64)
+            valid = valid & (exp_v > 0) & np.isfinite(exp_v)
+            out = exp_v * out
+    return np.where(valid, out, np.nan)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 @dataclass(frozen=True)
@@ -21,6 +22,19 @@ class PreflightGateSummary:
         return self.level == "BLOCKED"
 
 
+@lru_cache(maxsize=256)
+def _ready_summary(total_files: int) -> PreflightGateSummary:
+    """Shared READY summary; the frozen instance only varies by file count."""
+    return PreflightGateSummary(
+        level="READY",
+        score=0,
+        total_files=total_files,
+        failed_files=0,
+        warning_count=0,
+        risky_files=0,
+    )
+
+
 def evaluate_preflight_gate(
     total_files: int,
     failed_files: int,
@@ -41,6 +55,8 @@ def evaluate_preflight_gate(
     risky = max(0, int(risky_files))
 
     score = failed * 5 + risky * 2 + warnings
+    if score == 0 and total > 0:
+        return _ready_summary(total)
 
     if total <= 0 or failed > 0:
         level = "BLOCKED"
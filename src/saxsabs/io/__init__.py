@@ -1,6 +1,7 @@
 from .parsers import (
     extract_acquisition_timestamp,
     parse_header_values,
+    parse_header_values_batch,
     parse_header_values_with_meta,
     read_cansas1d_xml,
     read_external_1d_profile,
@@ -17,6 +18,7 @@ from .calibrated2d import (
 
 __all__ = [
     "parse_header_values",
+    "parse_header_values_batch",
     "parse_header_values_with_meta",
     "extract_acquisition_timestamp",
     "read_external_1d_profile",
@@ -18,14 +18,20 @@ This module addresses two common reproducibility pain points:
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+import csv
+from functools import lru_cache
 from io import StringIO
+import math
 import re
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
-import pandas as pd
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 FLOAT_PATTERN = re.compile(r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?")
@@ -85,7 +91,23 @@ def _read_text_operator_provenance(path: str | Path) -> dict[str, str]:
     return provenance
 
 def _clean_column_name(name: Any) -> str:
-    return re.sub(r"[^a-z0-9]+", "", str(name).strip().lower())
+    return _clean_column_name_str(str(name))
+
+
+# Deletes every ASCII character outside [a-z0-9] in one C-level pass.
+_COLUMN_NAME_KEEP = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+_COLUMN_NAME_STRIP = str.maketrans(
+    "", "", "".join(ch for ch in map(chr, range(128)) if ch not in _COLUMN_NAME_KEEP)
+)
+
+
+@lru_cache(maxsize=4096)
+def _clean_column_name_str(name: str) -> str:
+    # Column names repeat across the read trials and the three role picks.
+    lowered = name.strip().lower()
+    if lowered.isascii():
+        return lowered.translate(_COLUMN_NAME_STRIP)
+    return re.sub(r"[^a-z0-9]+", "", lowered)
 
 
 def _error_column_preference(name: Any) -> int:
@@ -104,7 +126,7 @@ def _error_column_preference(name: Any) -> int:
 def _match_column_score(
     name: str,
     *,
-    exact: set[str],
+    exact: frozenset[str],
     prefixes: tuple[str, ...] = (),
     suffixes: tuple[str, ...] = (),
 ) -> int:
@@ -117,13 +139,34 @@ def _match_column_score(
     return 0
 
 
+# Normalized column-name vocabularies for the q, intensity and error roles.
+_X_COLUMN_NAMES: dict[str, Any] = {
+    "exact": frozenset({"q", "chi", "radial", "2theta", "twotheta", "s", "x"}),
+    "prefixes": ("q", "chi", "radial", "twotheta"),
+    "suffixes": ("q",),
+}
+_I_COLUMN_NAMES: dict[str, Any] = {
+    "exact": frozenset({"i", "intensity", "irel", "iabs", "signal", "count", "counts", "y"}),
+    "prefixes": ("intensity", "signal", "count", "irel", "iabs"),
+    "suffixes": ("intensity",),
+}
+_ERR_COLUMN_NAMES: dict[str, Any] = {
+    "exact": frozenset(
+        {"err", "error", "errors", "sigma", "std", "stdev", "unc", "uncertainty", "idev"}
+    ),
+    "prefixes": ("err", "error", "sigma", "std", "unc", "idev"),
+    "suffixes": ("error", "sigma", "uncertainty"),
+}
+
+
 def _pick_named_column(
     cols: list[Any],
     used: set[Any],
     *,
-    exact: set[str],
+    exact: frozenset[str],
     prefixes: tuple[str, ...] = (),
     suffixes: tuple[str, ...] = (),
+    names: dict[Any, str] | None = None,
 ) -> tuple[Any, bool]:
     best = None
     best_score = 0
@@ -131,7 +174,7 @@ def _pick_named_column(
         if col in used:
             continue
         score = _match_column_score(
-            _clean_column_name(col),
+            names[col] if names is not None else _clean_column_name(col),
             exact=exact,
             prefixes=prefixes,
             suffixes=suffixes,
@@ -146,28 +189,111 @@ def _comment_header_score(tokens: list[str]) -> int:
     score = 0
     for token in tokens:
         name = _clean_column_name(token)
-        score += _match_column_score(
-            name,
-            exact={"q", "chi", "radial", "2theta", "twotheta", "s", "x"},
-            prefixes=("q", "chi", "radial", "twotheta"),
-            suffixes=("q",),
-        )
-        score += _match_column_score(
-            name,
-            exact={"i", "intensity", "irel", "iabs", "signal", "count", "counts", "y"},
-            prefixes=("intensity", "signal", "count", "irel", "iabs"),
-            suffixes=("intensity",),
-        )
-        score += _match_column_score(
-            name,
-            exact={"err", "error", "errors", "sigma", "std", "stdev", "unc", "uncertainty", "idev"},
-            prefixes=("err", "error", "sigma", "std", "unc", "idev"),
-            suffixes=("error", "sigma", "uncertainty"),
-        )
+        score += _match_column_score(name, **_X_COLUMN_NAMES)
+        score += _match_column_score(name, **_I_COLUMN_NAMES)
+        score += _match_column_score(name, **_ERR_COLUMN_NAMES)
     return score
 
 
+_SNIFF_BYTES = 65536
+_SNIFF_MAX_LINES = 64
+
+
+def _sniff_delimited_lines(lines: Iterable[str]) -> tuple[str, int, bool] | None:
+    """Detect ``(sep, width, has_header)`` from the leading data lines.
+
+    Blank and ``#`` lines are skipped and at most 64 data lines are
+    inspected.  Returns ``None`` unless every sampled line splits into the
+    same number (>= 2) of fields.
+    """
+    sample: list[str] = []
+    for line in lines:
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        sample.append(stripped)
+        if len(sample) >= _SNIFF_MAX_LINES:
+            break
+    if len(sample) < 2:
+        return None
+
+    try:
+        delimiter = csv.Sniffer().sniff("\n".join(sample), delimiters=",;\t").delimiter
+    except csv.Error:
+        delimiter = None
+
+    if delimiter is not None:
+        rows = [line.split(delimiter) for line in sample]
+        sep = delimiter
+    else:
+        rows = [line.split() for line in sample]
+        sep = r"\s+"
+    width = len(rows[0])
+    if width < 2 or any(len(row) != width for row in rows):
+        return None
+
+    first = [token.strip() for token in rows[0]]
+    numeric = sum(FLOAT_PATTERN.fullmatch(token) is not None for token in first)
+    return sep, width, numeric / width < 0.5
+
+
+def _sniff_profile_dialect(path: Path) -> tuple[str, bool] | None:
+    """Detect ``(sep, has_header)`` for a plain delimited numeric profile.
+
+    Only the first 64 KiB are inspected; see :func:`_sniff_delimited_lines`.
+    """
+    try:
+        with path.open("rb") as fh:
+            raw = fh.read(_SNIFF_BYTES)
+    except OSError:
+        return None
+    text = raw.decode("utf-8-sig", errors="replace")
+    if len(raw) == _SNIFF_BYTES:
+        # Drop the possibly truncated last line.
+        text = text.rsplit("\n", 1)[0]
+
+    dialect = _sniff_delimited_lines(text.splitlines())
+    if dialect is None:
+        return None
+    sep, _, has_header = dialect
+    return sep, has_header
+
+
+def _read_sniffed_dataframe(path: Path) -> pd.DataFrame | None:
+    """Read a cleanly delimited numeric profile in one C-engine pass.
+
+    Returns ``None`` when the dialect cannot be sniffed or the result is not
+    an all-numeric table, so the caller can fall back to the tolerant
+    python-engine trials.
+    """
+    import pandas as pd
+
+    dialect = _sniff_profile_dialect(path)
+    if dialect is None:
+        return None
+    sep, has_header = dialect
+    try:
+        df = pd.read_csv(
+            path,
+            sep=sep,
+            engine="c",
+            comment="#",
+            header=0 if has_header else None,
+            encoding="utf-8-sig",
+            low_memory=False,
+        )
+    except Exception:
+        return None
+    if df.empty or df.shape[1] < 2:
+        return None
+    if not all(dtype.kind in "fi" for dtype in df.dtypes):
+        return None
+    return df
+
+
 def _read_comment_header_dataframe(path: str | Path) -> pd.DataFrame | None:
+    import pandas as pd
+
     try:
         lines = Path(path).read_text(encoding="utf-8-sig", errors="ignore").splitlines()
     except Exception:
@@ -203,6 +329,24 @@ def _read_comment_header_dataframe(path: str | Path) -> pd.DataFrame | None:
     if not text:
         return None
 
+    # A cleanly delimited numeric body under the header is parsed by the C
+    # engine; anything irregular keeps the tolerant regex split below.
+    dialect = _sniff_delimited_lines(data_lines)
+    if dialect is not None and not dialect[2] and dialect[1] == len(header_tokens):
+        try:
+            df = pd.read_csv(
+                StringIO(text),
+                sep=dialect[0],
+                engine="c",
+                comment="#",
+                header=None,
+                names=header_tokens,
+            )
+        except Exception:
+            df = None
+        if df is not None and not df.empty and all(dtype.kind in "fi" for dtype in df.dtypes):
+            return df
+
     try:
         df = pd.read_csv(
             StringIO(text),
@@ -223,7 +367,14 @@ def _read_comment_header_dataframe(path: str | Path) -> pd.DataFrame | None:
 def norm_key(key: Any) -> str:
     if key is None:
         return ""
-    s = str(key).strip().lower().replace(" ", "")
+    return _norm_key_str(str(key))
+
+
+# Header keys and values repeat across the files of a directory scan, so the
+# string-level work is memoized on the coerced string.
+@lru_cache(maxsize=4096)
+def _norm_key_str(key: str) -> str:
+    s = key.strip().lower().replace(" ", "")
     s = s.replace("-", "").replace("_", "")
     return s
 
@@ -231,7 +382,12 @@ def norm_key(key: Any) -> str:
 def extract_float(raw: Any) -> float | None:
     if raw is None:
         return None
-    s = str(raw).strip()
+    return _extract_float_str(str(raw))
+
+
+@lru_cache(maxsize=4096)
+def _extract_float_str(raw: str) -> float | None:
+    s = raw.strip()
     if not s:
         return None
 
@@ -244,6 +400,19 @@ def extract_float(raw: Any) -> float | None:
     else:
         s = s.replace(",", "")
 
+    # Clean literals skip the regex; a trailing unit or letter is rejected
+    # up front because a failing float() costs more than the search.
+    # float() also accepts "1_000" and "1.e5", which the pattern reads
+    # differently, so those fall through.
+    if s[-1].isdigit() and "_" not in s and ".e" not in s and ".E" not in s:
+        try:
+            value = float(s)
+        except ValueError:
+            pass
+        else:
+            if math.isfinite(value):
+                return value
+
     m = FLOAT_PATTERN.search(s)
     if not m:
         return None
@@ -253,6 +422,18 @@ def extract_float(raw: Any) -> float | None:
         return None
 
 
+def _transmission_pct_hint(raw: Any, key: Any) -> bool:
+    raw_s = str(raw).strip().lower() if raw is not None else ""
+    key_s = norm_key(key) if key is not None else ""
+    return (
+        "%" in raw_s
+        or "percent" in raw_s
+        or "pct" in raw_s
+        or "percent" in key_s
+        or "pct" in key_s
+    )
+
+
 def normalize_transmission(trans: float | None, raw: Any = None, key: Any = None) -> float | None:
     if trans is None:
         return None
@@ -262,18 +443,11 @@ def normalize_transmission(trans: float | None, raw: Any = None, key: Any = None
         return None
     if not np.isfinite(t):
         return None
-    raw_s = str(raw).strip().lower() if raw is not None else ""
-    key_s = norm_key(key) if key is not None else ""
+    return _scale_transmission(t, _transmission_pct_hint(raw, key))
 
-    has_pct_hint = (
-        "%" in raw_s
-        or "percent" in raw_s
-        or "pct" in raw_s
-        or "percent" in key_s
-        or "pct" in key_s
-    )
 
-    if has_pct_hint:
+def _scale_transmission(t: float, pct_hint: bool) -> float | None:
+    if pct_hint:
         t /= 100.0
     elif 2.0 <= t <= 100.0:
         t /= 100.0
@@ -283,7 +457,69 @@ def normalize_transmission(trans: float | None, raw: Any = None, key: Any = None
     return t
 
 
-def parse_header_values(header_mapping: dict[str, Any] | None) -> tuple[float | None, float | None, float | None]:
+def _compile_header_keys(
+    keys: tuple[str, ...], exact_only: frozenset[str]
+) -> tuple[tuple[str, ...], re.Pattern[str], re.Pattern[str] | None]:
+    """Return ``(exact_keys, prefix_suffix_re, substring_re)`` for one category.
+
+    Keys in *exact_only* only match exactly; substring matching is limited
+    to keys of at least six characters.
+    """
+    fuzzy = "|".join(re.escape(k) for k in keys if k not in exact_only)
+    substring = "|".join(
+        re.escape(k) for k in keys if k not in exact_only and len(k) >= 6
+    )
+    return (
+        keys,
+        re.compile(rf"\A(?:{fuzzy})|(?:{fuzzy})\Z"),
+        re.compile(substring) if substring else None,
+    )
+
+
+_EXPOSURE_HEADER_KEYS = _compile_header_keys(
+    ("exposuretime", "counttime", "acqtime", "exposure", "time"),
+    frozenset({"time"}),
+)
+_MONITOR_HEADER_KEYS = _compile_header_keys(
+    ("monitor", "beammonitor", "ionchamber", "mon", "i0", "flux"),
+    frozenset({"mon", "i0"}),
+)
+_TRANSMISSION_HEADER_KEYS = _compile_header_keys(
+    ("sampletransmission", "transmission", "trans", "abs"),
+    frozenset({"abs"}),
+)
+
+
+def _find_header_value(
+    meta: dict[str, str],
+    spec: tuple[tuple[str, ...], re.Pattern[str], re.Pattern[str] | None],
+) -> tuple[str | None, str | None]:
+    """Look up a header value by exact key, then prefix/suffix, then substring."""
+    keys, prefix_suffix_re, substring_re = spec
+    for k in keys:
+        if k in meta:
+            return meta[k], k
+
+    for mk, mv in meta.items():
+        if prefix_suffix_re.search(mk):
+            return mv, mk
+
+    if substring_re is not None:
+        for mk, mv in meta.items():
+            if substring_re.search(mk):
+                return mv, mk
+
+    return None, None
+
+
+def _extract_header_raw(
+    header_mapping: dict[str, Any] | None,
+) -> tuple[float | None, float | None, float | None, float, bool]:
+    """Return ``(exp, mon, trans, exp_divisor, trans_pct_hint)`` before scaling.
+
+    All string work (key normalization, lookup, float extraction and unit
+    hints) happens here; the arithmetic is left to the caller.
+    """
     meta: dict[str, str] = {}
 
     def add_meta(k: Any, v: Any) -> None:
@@ -296,57 +532,141 @@ def parse_header_values(header_mapping: dict[str, Any] | None) -> tuple[float |
     for k, v in (header_mapping or {}).items():
         add_meta(k, v)
 
-    exp_keys = ["exposuretime", "counttime", "acqtime", "exposure", "time"]
-    mon_keys = ["monitor", "beammonitor", "ionchamber", "mon", "i0", "flux"]
-    trans_keys = ["sampletransmission", "transmission", "trans", "abs"]
-    exp_exact_only = {"time"}
-    mon_exact_only = {"mon", "i0"}
-    trans_exact_only = {"abs"}
-
-    def get_val(keys: list[str], exact_only: set[str] | None = None) -> tuple[str | None, str | None]:
-        exact_only = set(exact_only or set())
-
-        for k in keys:
-            if k in meta:
-                return meta[k], k
-
-        for mk, mv in meta.items():
-            for k in keys:
-                if k in exact_only:
-                    continue
-                if mk.startswith(k) or mk.endswith(k):
-                    return mv, mk
-
-        for mk, mv in meta.items():
-            for k in keys:
-                if k in exact_only or len(k) < 6:
-                    continue
-                if k in mk:
-                    return mv, mk
-
-        return None, None
-
-    exp_raw, exp_key = get_val(exp_keys, exp_exact_only)
-    mon_raw, _ = get_val(mon_keys, mon_exact_only)
-    trans_raw, trans_key = get_val(trans_keys, trans_exact_only)
+    exp_raw, exp_key = _find_header_value(meta, _EXPOSURE_HEADER_KEYS)
+    mon_raw, _ = _find_header_value(meta, _MONITOR_HEADER_KEYS)
+    trans_raw, trans_key = _find_header_value(meta, _TRANSMISSION_HEADER_KEYS)
 
     exp = extract_float(exp_raw)
     mon = extract_float(mon_raw)
     trans = extract_float(trans_raw)
 
+    exp_divisor = 1.0
     if exp is not None:
         exp_tag = f"{exp_key or ''} {exp_raw or ''}".lower()
         if "ms" in exp_tag:
-            exp /= 1000.0
+            exp_divisor = 1000.0
         elif "us" in exp_tag:
-            exp /= 1_000_000.0
+            exp_divisor = 1_000_000.0
+
+    pct_hint = trans is not None and _transmission_pct_hint(trans_raw, trans_key)
+    return exp, mon, trans, exp_divisor, pct_hint
 
-    trans = normalize_transmission(trans, raw=trans_raw, key=trans_key)
+
+def parse_header_values(header_mapping: dict[str, Any] | None) -> tuple[float | None, float | None, float | None]:
+    exp, mon, trans, exp_divisor, pct_hint = _extract_header_raw(header_mapping)
+    if exp is not None and exp_divisor != 1.0:
+        exp /= exp_divisor
+    if trans is not None:
+        trans = _scale_transmission(trans, pct_hint)
     return exp, mon, trans
 
 
-def read_external_1d_profile(path: str | Path) -> dict[str, Any]:
-    p = Path(path)
+def parse_header_values_batch(
+    header_mappings: Iterable[dict[str, Any] | None],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Parse many headers and return exposure, monitor and transmission arrays.
+
+    Equivalent to calling :func:`parse_header_values` per header, with
+    ``None`` results reported as NaN.  String handling stays per header;
+    the unit scaling and transmission normalization run vectorized over
+    the whole batch.
+
+    Parameters
+    ----------
+    header_mappings : iterable of dict or None
+        Header mappings, one per file.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        ``(exp, mon, trans)`` float64 arrays of equal length.
+    """
+    rows = [_extract_header_raw(h) for h in header_mappings]
+    n = len(rows)
+    exp = np.full(n, np.nan)
+    mon = np.full(n, np.nan)
+    trans = np.full(n, np.nan)
+    exp_divisor = np.ones(n)
+    pct_hint = np.zeros(n, dtype=bool)
+    for idx, (e, m, t, div, pct) in enumerate(rows):
+        if e is not None:
+            exp[idx] = e
+        if m is not None:
+            mon[idx] = m
+        if t is not None:
+            trans[idx] = t
+        exp_divisor[idx] = div
+        pct_hint[idx] = pct
+
+    exp /= exp_divisor
+    with np.errstate(invalid="ignore"):
+        pct_scale = pct_hint | ((trans >= 2.0) & (trans <= 100.0))
+        np.divide(trans, 100.0, out=trans, where=pct_scale)
+        trans[~np.isfinite(trans) | (trans <= 0) | (trans > 1.0)] = np.nan
+    return exp, mon, trans
+
+
+_GOOD_ENOUGH_ROWS = 100
+
+
+def _is_good_enough_dataframe(df: pd.DataFrame) -> bool:
+    """Whether a read trial is clean enough to skip the remaining trials.
+
+    The frame needs at least 100 rows, a real text header (so a headerless
+    retry cannot gain a row) and only natively numeric, finite columns, so
+    whichever columns get picked keep every row and a later trial can at
+    most tie on point count.
+    """
+    if len(df) < _GOOD_ENOUGH_ROWS:
+        return False
+    if any(FLOAT_PATTERN.fullmatch(str(col).strip()) for col in df.columns):
+        return False
+    if not all(dtype.kind in "fi" for dtype in df.dtypes):
+        return False
+    return bool(np.isfinite(df.to_numpy(dtype=np.float64)).all())
+
+
+_PROFILE_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+
+def read_external_1d_profile(
+    path: str | Path, *, dtype: np.dtype | type = np.float64
+) -> dict[str, Any]:
+    """Read a 1-D profile from a delimited text, canSAS XML or NXcanSAS file.
+
+    Parameters
+    ----------
+    path : str or Path
+        Profile file; ``.xml`` and HDF5 extensions are routed to
+        :func:`read_cansas1d_xml` and :func:`read_nxcansas_h5`.
+    dtype : numpy dtype
+        Precision of the returned ``x``/``i_rel``/``err_rel`` arrays,
+        ``float64`` (default) or ``float32``.  Parsing and column selection
+        always run in double precision; ``float32`` only halves the memory
+        of the result and is meant for plotting or interpolation, not for
+        absolute-calibration arithmetic.
+
+    Returns
+    -------
+    dict
+        ``profile``, an ``(n, 3)`` Fortran-ordered array whose rows are
+        ``(q, I, err)`` points sorted by ``q``; ``x``, ``i_rel`` and
+        ``err_rel`` are its C-contiguous column views (no copies).  Also
+        holds the source column names and operator provenance.
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in _PROFILE_DTYPES:
+        raise ValueError("dtype must be float32 or float64")
+    result = _read_external_1d_profile(Path(path))
+    profile = np.empty((result["x"].size, 3), dtype=dtype, order="F")
+    for col, key in enumerate(("x", "i_rel", "err_rel")):
+        profile[:, col] = result[key]
+        result[key] = profile[:, col]
+    result["profile"] = profile
+    return result
+
+
+def _read_external_1d_profile(p: Path) -> dict[str, Any]:
     ext = p.suffix.lower()
 
     # Route to specialized readers based on file extension
@@ -358,6 +678,10 @@ def read_external_1d_profile(path: str | Path) -> dict[str, Any]:
     elif ext in (".h5", ".hdf5", ".hdf", ".nxs"):
         return read_nxcansas_h5(p)
 
+    # pandas is only needed for delimited text; importing it lazily keeps
+    # ``import saxsabs`` (and the GUI launcher) free of its startup cost.
+    import pandas as pd
+
     dfs: list[pd.DataFrame] = []
     errs: list[str] = []
 
@@ -365,57 +689,51 @@ def read_external_1d_profile(path: str | Path) -> dict[str, Any]:
     if comment_header_df is not None:
         dfs.append(comment_header_df)
 
-    read_trials: list[dict[str, Any]] = [
-        {"sep": None, "engine": "python", "comment": "#"},
-        {"sep": r"[,\s;]+", "engine": "python", "comment": "#"},
-        {"sep": r"[,\s;]+", "engine": "python", "comment": "#", "header": None},
-    ]
+    sniffed_df = _read_sniffed_dataframe(p)
+    if sniffed_df is not None:
+        dfs.append(sniffed_df)
+    else:
+        read_trials: list[dict[str, Any]] = [
+            {"sep": None, "engine": "python", "comment": "#"},
+            {"sep": r"[,\s;]+", "engine": "python", "comment": "#"},
+            {"sep": r"[,\s;]+", "engine": "python", "comment": "#", "header": None},
+        ]
 
-    for kw in read_trials:
-        try:
-            df = pd.read_csv(path, encoding="utf-8-sig", **kw)
-            if df is not None and not df.empty and df.shape[1] >= 2:
-                dfs.append(df)
-        except Exception as exc:
-            errs.append(str(exc))
+        for kw in read_trials:
+            try:
+                df = pd.read_csv(p, encoding="utf-8-sig", **kw)
+                if df is not None and not df.empty and df.shape[1] >= 2:
+                    dfs.append(df)
+                    if _is_good_enough_dataframe(df):
+                        break
+            except Exception as exc:
+                errs.append(str(exc))
 
     if not dfs:
-        raise ValueError(f"Cannot parse file: {Path(path).name} ({'; '.join(errs[:2])})")
+        raise ValueError(f"Cannot parse file: {p.name} ({'; '.join(errs[:2])})")
 
     best: dict[str, Any] | None = None
     best_rank: tuple[int, int] = (-1, -1)
 
     for df in dfs:
-        numeric_cols: dict[Any, pd.Series] = {}
-        for col in df.columns:
-            s = pd.to_numeric(df[col], errors="coerce")
-            arr = s.to_numpy(dtype=np.float64, na_value=np.nan)
-            cnt = int(np.isfinite(arr).sum())
-            if cnt >= 3:
-                numeric_cols[col] = s
-
-        if len(numeric_cols) < 2:
-            continue
+        # Coerce every column once into a single float64 block; all later
+        # column extractions are plain views into it.
+        block = df.apply(pd.to_numeric, errors="coerce").to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        col_index = {col: idx for idx, col in enumerate(df.columns)}
+        names = {col: _clean_column_name(col) for col in df.columns}
+        finite_counts = np.isfinite(block).sum(axis=0)
+        cols = [col for col, cnt in zip(df.columns, finite_counts) if cnt >= 3]
 
-        cols = list(numeric_cols.keys())
+        if len(cols) < 2:
+            continue
 
-        x_col, x_named = _pick_named_column(
-            cols,
-            set(),
-            exact={"q", "chi", "radial", "2theta", "twotheta", "s", "x"},
-            prefixes=("q", "chi", "radial", "twotheta"),
-            suffixes=("q",),
-        )
+        x_col, x_named = _pick_named_column(cols, set(), names=names, **_X_COLUMN_NAMES)
         if x_col is None:
             x_col = cols[0]
 
-        i_col, i_named = _pick_named_column(
-            cols,
-            {x_col},
-            exact={"i", "intensity", "irel", "iabs", "signal", "count", "counts", "y"},
-            prefixes=("intensity", "signal", "count", "irel", "iabs"),
-            suffixes=("intensity",),
-        )
+        i_col, i_named = _pick_named_column(cols, {x_col}, names=names, **_I_COLUMN_NAMES)
         if i_col is None:
             i_col = next((c for c in cols if c != x_col), None)
         if i_col is None:
@@ -428,13 +746,12 @@ def read_external_1d_profile(path: str | Path) -> dict[str, Any]:
         err_col, err_named = _pick_named_column(
             sorted(df.columns, key=_error_column_preference),
             {x_col, i_col},
-            exact={"err", "error", "errors", "sigma", "std", "stdev", "unc", "uncertainty", "idev"},
-            prefixes=("err", "error", "sigma", "std", "unc", "idev"),
-            suffixes=("error", "sigma", "uncertainty"),
+            names=names,
+            **_ERR_COLUMN_NAMES,
         )
 
-        x = pd.to_numeric(df[x_col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
-        i_rel = pd.to_numeric(df[i_col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+        x = block[:, col_index[x_col]]
+        i_rel = block[:, col_index[i_col]]
         mask = np.isfinite(x) & np.isfinite(i_rel)
         if int(mask.sum()) < 3:
             continue
@@ -443,8 +760,8 @@ def read_external_1d_profile(path: str | Path) -> dict[str, Any]:
         i_rel = i_rel[mask]
 
         if err_named and err_col is not None:
-            err = pd.to_numeric(df[err_col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)[mask]
-            err = np.where(np.isfinite(err), err, np.nan)
+            err = block[:, col_index[err_col]][mask]
+            err[~np.isfinite(err)] = np.nan
         else:
             err = np.full_like(i_rel, np.nan, dtype=np.float64)
 
@@ -468,7 +785,7 @@ def read_external_1d_profile(path: str | Path) -> dict[str, Any]:
             }
 
     if best is None:
-        raise ValueError(f"Cannot identify valid numeric columns in {Path(path).name}")
+        raise ValueError(f"Cannot identify valid numeric columns in {p.name}")
     best["operator_provenance"] = _read_text_operator_provenance(p)
     return best
 
@@ -479,6 +796,32 @@ def read_external_1d_profile(path: str | Path) -> dict[str, Any]:
 _CANSAS_NS = "urn:cansas1d:1.1"
 
 
+_CANSAS_INITIAL_CAPACITY = 1024
+
+
+def _parse_cansas_idata(
+    idata: ET.Element, tag_q: str, tag_i: str, tag_idev: str
+) -> tuple[float, float, float] | None:
+    """Return ``(q, i, idev)`` for one ``<Idata>``, or ``None`` if unusable."""
+    q_el = idata.find(tag_q)
+    i_el = idata.find(tag_i)
+    if q_el is None or i_el is None:
+        return None
+    try:
+        q_val = float(q_el.text)
+        i_val = float(i_el.text)
+    except (TypeError, ValueError):
+        return None
+    e_val = np.nan
+    e_el = idata.find(tag_idev)
+    if e_el is not None and e_el.text:
+        try:
+            e_val = float(e_el.text)
+        except (TypeError, ValueError):
+            pass
+    return q_val, i_val, e_val
+
+
 def read_cansas1d_xml(path: str | Path) -> dict[str, Any]:
     """Read a canSAS 1D XML file and return a profile dict.
 
@@ -486,59 +829,71 @@ def read_cansas1d_xml(path: str | Path) -> dict[str, Any]:
     :func:`read_external_1d_profile`.
     """
     p = Path(path)
-    tree = ET.parse(str(p))
-    root = tree.getroot()
 
-    # Handle both namespaced and non-namespaced XML.
-    ns = ""
-    if root.tag.startswith("{"):
-        ns = root.tag.split("}")[0] + "}"
-
-    # Find SASdata → Idata elements
-    q_vals: list[float] = []
-    i_vals: list[float] = []
-    e_vals: list[float] = []
+    # Q, I and Idev buffers grow geometrically and are trimmed at the end.
+    q_buf = np.empty(_CANSAS_INITIAL_CAPACITY, dtype=np.float64)
+    i_buf = np.empty_like(q_buf)
+    e_buf = np.empty_like(q_buf)
+    n_points = 0
     intensity_unit = ""
+    operator_provenance: dict[str, str] = {}
 
-    for idata in root.iter(f"{ns}Idata"):
-        q_el = idata.find(f"{ns}Q")
-        i_el = idata.find(f"{ns}I")
-        if q_el is None or i_el is None:
-            continue
-        try:
-            q_vals.append(float(q_el.text))
-            i_vals.append(float(i_el.text))
-            if not intensity_unit:
-                intensity_unit = str(i_el.attrib.get("unit", "") or "").strip()
-        except (TypeError, ValueError):
+    # Parse incrementally: each <Idata> is consumed as soon as it closes and
+    # then detached, so the full per-point DOM is never held in memory.
+    ns = ""
+    tag_idata = tag_q = tag_i = tag_idev = tag_process = tag_term = ""
+    stack: list[ET.Element] = []
+    process_depth = 0
+    for event, elem in ET.iterparse(str(p), events=("start", "end")):
+        if event == "start":
+            if not stack:
+                # Handle both namespaced and non-namespaced XML.
+                if elem.tag.startswith("{"):
+                    ns = elem.tag.split("}")[0] + "}"
+                tag_idata = f"{ns}Idata"
+                tag_q = f"{ns}Q"
+                tag_i = f"{ns}I"
+                tag_idev = f"{ns}Idev"
+                tag_process = f"{ns}SASprocess"
+                tag_term = f"{ns}term"
+            elif elem.tag == tag_process:
+                process_depth += 1
+            stack.append(elem)
             continue
-        e_el = idata.find(f"{ns}Idev")
-        if e_el is not None and e_el.text:
-            try:
-                e_vals.append(float(e_el.text))
-            except (TypeError, ValueError):
-                e_vals.append(np.nan)
-        else:
-            e_vals.append(np.nan)
 
-    if len(q_vals) < 2:
+        stack.pop()
+        if elem.tag == tag_idata:
+            row = _parse_cansas_idata(elem, tag_q, tag_i, tag_idev)
+            if row is not None:
+                if n_points == q_buf.size:
+                    q_buf = np.concatenate((q_buf, np.empty_like(q_buf)))
+                    i_buf = np.concatenate((i_buf, np.empty_like(i_buf)))
+                    e_buf = np.concatenate((e_buf, np.empty_like(e_buf)))
+                q_buf[n_points], i_buf[n_points], e_buf[n_points] = row
+                n_points += 1
+                if not intensity_unit:
+                    i_el = elem.find(tag_i)
+                    intensity_unit = str(i_el.attrib.get("unit", "") or "").strip()
+            if stack:
+                del stack[-1][-1]
+        elif elem.tag == tag_process:
+            process_depth -= 1
+        elif elem.tag == tag_term and process_depth > 0:
+            key = _operator_provenance_key(elem.attrib.get("name", ""))
+            if key is not None and elem.text is not None:
+                operator_provenance[key] = elem.text.strip()
+
+    if n_points < 2:
         raise ValueError(f"canSAS XML contains too few data points: {p.name}")
 
-    x = np.asarray(q_vals, dtype=np.float64)
-    i_rel = np.asarray(i_vals, dtype=np.float64)
-    err = np.asarray(e_vals, dtype=np.float64) if e_vals else np.full_like(x, np.nan)
-
-    operator_provenance: dict[str, str] = {}
-    for process in root.iter(f"{ns}SASprocess"):
-        for term in process.iter(f"{ns}term"):
-            key = _operator_provenance_key(term.attrib.get("name", ""))
-            if key is not None and term.text is not None:
-                operator_provenance[key] = term.text.strip()
-    order = np.argsort(x)
+    order = np.argsort(q_buf[:n_points])
+    x = q_buf[order]
+    i_rel = i_buf[order]
+    err = e_buf[order]
     return {
-        "x": x[order],
-        "i_rel": i_rel[order],
-        "err_rel": err[order],
+        "x": x,
+        "i_rel": i_rel,
+        "err_rel": err,
         "x_col": "Q",
         "i_col": "I",
         "err_col": "Idev",
@@ -551,6 +906,20 @@ def read_cansas1d_xml(path: str | Path) -> dict[str, Any]:
 # NXcanSAS HDF5 reader
 # ---------------------------------------------------------------------------
 
+def _read_h5_float64(dataset: Any) -> np.ndarray:
+    """Read a numeric HDF5 dataset straight into a new float64 array.
+
+    libhdf5 converts the stored type while filling the buffer, so no
+    intermediate array in the on-disk dtype is allocated.
+    """
+    if dataset.dtype.kind not in "fiu":
+        return np.asarray(dataset[()], dtype=np.float64)
+    out = np.empty(dataset.shape, dtype=np.float64)
+    if out.size:
+        dataset.read_direct(out)
+    return out
+
+
 def read_nxcansas_h5(path: str | Path) -> dict[str, Any]:
     """Read an NXcanSAS HDF5 file and return a profile dict.
 
@@ -568,45 +937,39 @@ def read_nxcansas_h5(path: str | Path) -> dict[str, Any]:
     p = Path(path)
     operator_provenance: dict[str, str] = {}
     with h5py.File(str(p), "r") as f:
-        # Walk groups to find the first SASdata containing Q and I datasets.
+        # One C-level traversal finds the first SASdata group containing Q and
+        # I datasets (pre-order, name-sorted, like a recursive walk) and
+        # collects SASprocess provenance terms.
         q_ds = None
         i_ds = None
         e_ds = None
         intensity_unit = ""
 
-        def _find_sasdata(group: Any) -> bool:
-            nonlocal q_ds, i_ds, e_ds, intensity_unit
+        def _group_class(group: Any) -> str:
             cls = group.attrs.get("canSAS_class", "")
-            if isinstance(cls, bytes):
-                cls = cls.decode()
-            if cls == "SASdata" or group.name.rsplit("/", 1)[-1].startswith("sasdata"):
-                if "Q" in group and "I" in group:
-                    q_ds = group["Q"][()]
-                    i_ds = group["I"][()]
-                    raw_unit = group["I"].attrs.get("units", "")
-                    if isinstance(raw_unit, bytes):
-                        raw_unit = raw_unit.decode("utf-8", errors="replace")
-                    intensity_unit = str(raw_unit or "").strip()
-                    if "Idev" in group:
-                        e_ds = group["Idev"][()]
-                    return True
-            for key in group:
-                item = group[key]
-                if hasattr(item, "keys"):  # is a group
-                    if _find_sasdata(item):
-                        return True
-            return False
-
-        _find_sasdata(f)
-
-        def _collect_operator_provenance(_name: str, item: Any) -> None:
-            if not isinstance(item, h5py.Group):
-                return
-            cls = item.attrs.get("canSAS_class", "")
             if isinstance(cls, bytes):
                 cls = cls.decode("utf-8", errors="replace")
+            return cls
+
+        def _read_sasdata(group: Any) -> bool:
+            nonlocal q_ds, i_ds, e_ds, intensity_unit
+            if _group_class(group) != "SASdata" and not group.name.rsplit("/", 1)[-1].startswith("sasdata"):
+                return False
+            if "Q" not in group or "I" not in group:
+                return False
+            q_ds = _read_h5_float64(group["Q"])
+            i_ds = _read_h5_float64(group["I"])
+            raw_unit = group["I"].attrs.get("units", "")
+            if isinstance(raw_unit, bytes):
+                raw_unit = raw_unit.decode("utf-8", errors="replace")
+            intensity_unit = str(raw_unit or "").strip()
+            if "Idev" in group:
+                e_ds = _read_h5_float64(group["Idev"])
+            return True
+
+        def _collect_operator_provenance(item: Any) -> None:
             group_name = item.name.rsplit("/", 1)[-1].lower()
-            if cls != "SASprocess" and not group_name.startswith("sasprocess"):
+            if _group_class(item) != "SASprocess" and not group_name.startswith("sasprocess"):
                 return
             for dataset_name, dataset in item.items():
                 key = _operator_provenance_key(dataset_name)
@@ -621,17 +984,21 @@ def read_nxcansas_h5(path: str | Path) -> dict[str, Any]:
                     value = str(raw)
                 operator_provenance[key] = value.strip()
 
-        f.visititems(_collect_operator_provenance)
+        def _visit(_name: str, item: Any) -> None:
+            if not isinstance(item, h5py.Group):
+                return
+            if q_ds is None:
+                _read_sasdata(item)
+            _collect_operator_provenance(item)
+
+        _read_sasdata(f)
+        f.visititems(_visit)
     if q_ds is None or i_ds is None:
         raise ValueError(f"Cannot find SASdata/Q,I datasets in {p.name}")
 
-    x = np.asarray(q_ds, dtype=np.float64).ravel()
-    i_rel = np.asarray(i_ds, dtype=np.float64).ravel()
-    err = (
-        np.asarray(e_ds, dtype=np.float64).ravel()
-        if e_ds is not None
-        else np.full_like(x, np.nan)
-    )
+    x = q_ds.ravel()
+    i_rel = i_ds.ravel()
+    err = e_ds.ravel() if e_ds is not None else np.full_like(x, np.nan)
 
     if x.shape != i_rel.shape:
         raise ValueError(
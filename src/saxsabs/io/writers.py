@@ -9,6 +9,7 @@ Supported output formats:
 from __future__ import annotations
 
 import xml.etree.ElementTree as ET
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -67,6 +68,51 @@ def _operator_provenance_from_metadata(metadata: dict[str, Any]) -> dict[str, st
             provenance[key] = str(value).strip()
     return provenance
 
+# Pre-indented <Idata> row fragments matching ``ET.indent(space="  ")`` output.
+_IDATA_ROW = (
+    '\n      <Idata>'
+    '\n        <Q unit="1/A">%.8g</Q>'
+    '\n        <I unit="1/cm">%.8g</I>'
+)
+_IDEV_ROW = '\n        <Idev unit="1/cm">%.8g</Idev>'
+_IDATA_CLOSE = "\n      </Idata>"
+# Whole-row templates so each point costs one %-format and no concatenation.
+_IDATA_ROW_NO_IDEV = _IDATA_ROW + _IDATA_CLOSE
+_IDATA_ROW_WITH_IDEV = _IDATA_ROW + _IDEV_ROW + _IDATA_CLOSE
+_SASDATA_OPEN = b"<SASdata>"
+_SASDATA_CLOSE = b"\n    </SASdata>"
+_SASDATA_PLACEHOLDER = "@IDATA@"
+_SASDATA_SPLIT = b"<SASdata>" + _SASDATA_PLACEHOLDER.encode("ascii") + b"</SASdata>"
+_IDATA_WRITE_BLOCK = 4096
+
+
+def _iter_idata_blocks(
+    q_arr: np.ndarray, i_arr: np.ndarray, e_arr: np.ndarray | None
+) -> Iterator[bytes]:
+    """Yield encoded ``<Idata>`` rows in fixed-size blocks."""
+    q_vals = q_arr.tolist()
+    i_vals = i_arr.tolist()
+    # Finiteness of Idev is decided once for the whole array, not per row.
+    e_vals = e_arr.tolist() if e_arr is not None else None
+    e_finite = np.isfinite(e_arr).tolist() if e_arr is not None else None
+    for start in range(0, len(q_vals), _IDATA_WRITE_BLOCK):
+        stop = start + _IDATA_WRITE_BLOCK
+        q_block = q_vals[start:stop]
+        i_block = i_vals[start:stop]
+        if e_vals is None:
+            rows = [_IDATA_ROW_NO_IDEV % pair for pair in zip(q_block, i_block)]
+        else:
+            rows = [
+                _IDATA_ROW_WITH_IDEV % (q_val, i_val, e_val)
+                if finite
+                else _IDATA_ROW_NO_IDEV % (q_val, i_val)
+                for q_val, i_val, e_val, finite in zip(
+                    q_block, i_block, e_vals[start:stop], e_finite[start:stop]
+                )
+            ]
+        yield "".join(rows).encode("ascii")
+
+
 def _prepare_profile_arrays(
     q: np.ndarray,
     i_abs: np.ndarray,
@@ -136,15 +182,10 @@ def write_cansas1d_xml(
     sasdata = ET.SubElement(entry, "SASdata")
     q_arr, i_arr, e_arr = _prepare_profile_arrays(q, i_abs, err)
 
-    for idx in range(q_arr.size):
-        idata = ET.SubElement(sasdata, "Idata")
-        qel = ET.SubElement(idata, "Q", unit="1/A")
-        qel.text = f"{q_arr[idx]:.8g}"
-        iel = ET.SubElement(idata, "I", unit="1/cm")
-        iel.text = f"{i_arr[idx]:.8g}"
-        if e_arr is not None and np.isfinite(e_arr[idx]):
-            eel = ET.SubElement(idata, "Idev", unit="1/cm")
-            eel.text = f"{e_arr[idx]:.8g}"
+    # The <Idata> rows are streamed into the file at write time instead of
+    # being built as one ElementTree node triple per point.
+    if q_arr.size:
+        sasdata.text = _SASDATA_PLACEHOLDER
 
     # --- SASsample ---
     sassample = ET.SubElement(entry, "SASsample")
@@ -176,29 +217,66 @@ def write_cansas1d_xml(
     # Write
     tree = ET.ElementTree(root)
     ET.indent(tree, space="  ")
+    document = ET.tostring(root, encoding="utf-8", xml_declaration=True)
     out.parent.mkdir(parents=True, exist_ok=True)
-    tree.write(str(out), xml_declaration=True, encoding="utf-8")
+    with out.open("wb") as fh:
+        if not q_arr.size:
+            fh.write(document)
+            return out
+        # Escaped text can never contain a literal "<SASdata>" tag, so the
+        # placeholder element is unambiguous.
+        head, tail = document.split(_SASDATA_SPLIT, 1)
+        fh.write(head)
+        fh.write(_SASDATA_OPEN)
+        for block in _iter_idata_blocks(q_arr, i_arr, e_arr):
+            fh.write(block)
+        fh.write(_SASDATA_CLOSE)
+        fh.write(tail)
     return out
 
 
 # ---------------------------------------------------------------------------
 # NXcanSAS HDF5
 # ---------------------------------------------------------------------------
+_H5_PROFILE_CHUNK = 4096
+
+
+def _h5_profile_storage(n_points: int) -> dict[str, Any]:
+    """Chunked shuffle + gzip storage options for 1-D profile datasets."""
+    if n_points == 0:
+        return {}
+    return {
+        "chunks": (min(_H5_PROFILE_CHUNK, n_points),),
+        "compression": "gzip",
+        "compression_opts": 4,
+        "shuffle": True,
+    }
+
+
 def write_nxcansas_h5(
     path: str | Path,
     q: np.ndarray,
     i_abs: np.ndarray,
     err: np.ndarray | None = None,
     metadata: dict[str, Any] | None = None,
+    *,
+    dtype: np.dtype | type = np.float64,
 ) -> Path:
     """Write a 1-D SAXS profile in NXcanSAS (NeXus HDF5) format.
 
-    Requires the ``h5py`` package (``pip install saxsabs[hdf5]``).
+    Requires the ``h5py`` package (``pip install saxsabs[hdf5]``).  The
+    ``Q``/``I``/``Idev`` datasets are chunked and stored with shuffle + gzip
+    compression.
 
     Parameters
     ----------
     path, q, i_abs, err, metadata
         Same as :func:`write_cansas1d_xml`.
+    dtype : numpy dtype
+        On-disk precision of the ``Q``/``I``/``Idev`` datasets, ``float64``
+        (default) or ``float32``.  Single precision halves the file size but
+        should only be used for archives that will not feed further error
+        propagation.
 
     Returns
     -------
@@ -213,10 +291,19 @@ def write_nxcansas_h5(
             "Install it with:  pip install saxsabs[hdf5]"
         ) from exc
 
+    dtype = np.dtype(dtype)
+    if dtype not in (np.dtype(np.float32), np.dtype(np.float64)):
+        raise ValueError("dtype must be float32 or float64")
+
     meta = metadata or {}
     out = Path(path)
     out.parent.mkdir(parents=True, exist_ok=True)
     q_arr, i_arr, e_arr = _prepare_profile_arrays(q, i_abs, err)
+    q_arr = q_arr.astype(dtype, copy=False)
+    i_arr = i_arr.astype(dtype, copy=False)
+    if e_arr is not None:
+        e_arr = e_arr.astype(dtype, copy=False)
+    storage = _h5_profile_storage(q_arr.size)
 
     with h5py.File(str(out), "w") as f:
         entry = f.create_group("sasentry01")
@@ -235,14 +322,14 @@ def write_nxcansas_h5(
         data.attrs["I_axes"] = "Q"
         data.attrs["Q_indices"] = 0
 
-        ds_q = data.create_dataset("Q", data=q_arr)
+        ds_q = data.create_dataset("Q", data=q_arr, **storage)
         ds_q.attrs["units"] = "1/angstrom"
 
-        ds_i = data.create_dataset("I", data=i_arr)
+        ds_i = data.create_dataset("I", data=i_arr, **storage)
         ds_i.attrs["units"] = "1/cm"
 
         if e_arr is not None:
-            ds_e = data.create_dataset("Idev", data=e_arr)
+            ds_e = data.create_dataset("Idev", data=e_arr, **storage)
             ds_e.attrs["units"] = "1/cm"
 
         # SASinstrument (minimal)
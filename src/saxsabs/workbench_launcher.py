@@ -8,6 +8,7 @@ import importlib.util
 import inspect
 import logging
 import os
+import sys
 import tempfile
 import traceback
 from collections.abc import Callable
@@ -107,8 +108,10 @@ def _load_legacy_module():
     spec = importlib.util.spec_from_file_location("saxsabs_legacy_app", app_source)
     if spec is None or spec.loader is None:
         raise RuntimeError(f"Cannot load application module: {app_source}")
+    _LOGGER.info("Loading application module: %s", app_source)
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
+    _LOGGER.info("Application module loaded")
     return module
 
 
@@ -137,7 +140,17 @@ def _create_app(app_cls: type, root: tk.Tk, language: str):
     return app_cls(root)
 
 
+def _display_available() -> bool:
+    """Return whether a Tk error dialog can be shown without a display probe."""
+    if sys.platform in ("win32", "darwin"):
+        return True
+    return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
+
 def _show_launch_error(error_path: Path | None) -> None:
+    # Headless sessions (CI smoke tests, SSH) would only fail again inside tk.Tk().
+    if not _display_available():
+        return
     if error_path is None:
         details = "No writable user or temporary log directory was available."
     else:
@@ -1,57 +1,61 @@
 """Tests for buffer / solvent subtraction."""
 
+import logging
+
 import numpy as np
 import pytest
 
 from saxsabs.core.buffer_subtraction import (
     BufferSubtractionResult,
     subtract_buffer,
+    subtract_buffer_batch,
     validate_alpha,
 )
 
 
+def _make_buffer_data(n=100):
+    q = np.linspace(0.01, 0.30, n)
+    i_sample = 50.0 / q + 5.0  # signal + buffer
+    i_buffer = np.full(n, 5.0)
+    err_s = np.full(n, 0.1)
+    err_b = np.full(n, 0.05)
+    return q, i_sample, err_s, i_buffer, err_b
+
+
+@pytest.fixture(scope="module")
+def buffer_data():
+    """Shared read-only ``(q, i_s, e_s, i_b, e_b)`` arrays; copy before mutating."""
+    arrays = _make_buffer_data()
+    for arr in arrays:
+        arr.setflags(write=False)
+    return arrays
+
+
+@pytest.fixture(scope="module")
+def interp_grids(buffer_data):
+    """Shared read-only sample (100 points) and buffer (200 points) curves on distinct q grids."""
+    q_s = buffer_data[0]
+    q_b = np.linspace(0.005, 0.35, 200)
+    arrays = (np.full(100, 10.0), np.full(100, 0.1), q_b, np.full(200, 3.0), np.full(200, 0.05))
+    for arr in arrays:
+        arr.setflags(write=False)
+    return (q_s, *arrays)
+
+
 class TestSubtractBuffer:
-    def _make_data(self, n=100):
-        q = np.linspace(0.01, 0.30, n)
-        i_sample = 50.0 / q + 5.0  # signal + buffer
-        i_buffer = np.full(n, 5.0)
-        err_s = np.full(n, 0.1)
-        err_b = np.full(n, 0.05)
-        return q, i_sample, err_s, i_buffer, err_b
-
-    def test_basic_subtraction(self):
-        q, i_s, e_s, i_b, e_b = self._make_data()
-        result = subtract_buffer(q, i_s, e_s, q, i_b, e_b, alpha=1.0)
+    @pytest.mark.parametrize("alpha", [1.0, 0.9])
+    def test_subtract_matches_reference(self, buffer_data, alpha):
+        q, i_s, e_s, i_b, e_b = buffer_data
+        result = subtract_buffer(q, i_s, e_s, q, i_b, e_b, alpha=alpha, alpha_uncertainty=0.0)
+
         assert isinstance(result, BufferSubtractionResult)
-        expected = i_s - i_b
-        np.testing.assert_allclose(result.i_subtracted, expected, rtol=1e-10)
-
-    def test_alpha_scaling(self):
-        q, i_s, e_s, i_b, e_b = self._make_data()
-        alpha = 0.9
-        result = subtract_buffer(q, i_s, e_s, q, i_b, e_b, alpha=alpha)
-        expected = i_s - alpha * i_b
-        np.testing.assert_allclose(result.i_subtracted, expected, rtol=1e-10)
-
-    def test_error_propagation(self):
-        q, i_s, e_s, i_b, e_b = self._make_data()
-        alpha = 1.0
-        result = subtract_buffer(
-            q,
-            i_s,
-            e_s,
-            q,
-            i_b,
-            e_b,
-            alpha=alpha,
-            alpha_uncertainty=0.0,
-        )
+        np.testing.assert_allclose(result.i_subtracted, i_s - alpha * i_b, rtol=1e-10)
         expected_err = np.sqrt(e_s**2 + alpha**2 * e_b**2)
         np.testing.assert_allclose(result.err_statistical, expected_err, rtol=1e-10)
         np.testing.assert_allclose(result.err_subtracted, expected_err, rtol=1e-10)
 
     def test_missing_alpha_uncertainty_keeps_combined_uncertainty_unknown(self):
-        q, i_s, e_s, i_b, e_b = self._make_data(n=5)
+        q, i_s, e_s, i_b, e_b = _make_buffer_data(n=5)
 
         result = subtract_buffer(q, i_s, e_s, q, i_b, e_b)
 
@@ -62,7 +66,7 @@ class TestSubtractBuffer:
 
     @pytest.mark.parametrize("missing", ["sample", "buffer"])
     def test_missing_input_uncertainty_remains_unknown(self, missing):
-        q, i_s, e_s, i_b, e_b = self._make_data(n=5)
+        q, i_s, e_s, i_b, e_b = _make_buffer_data(n=5)
         if missing == "sample":
             e_s = None
         else:
@@ -75,7 +79,7 @@ class TestSubtractBuffer:
         assert np.all(np.isnan(result.err_subtracted))
 
     def test_partial_unknown_input_uncertainty_is_not_replaced_by_zero(self):
-        q, i_s, e_s, i_b, e_b = self._make_data(n=5)
+        q, i_s, e_s, i_b, e_b = _make_buffer_data(n=5)
         e_s[2] = np.nan
 
         result = subtract_buffer(
@@ -101,6 +105,23 @@ class TestSubtractBuffer:
         # At the midpoint, Var(buffer) = 0.5²*1² + 0.5²*3² = 2.5.
         assert result.err_subtracted[0] == pytest.approx(np.sqrt(0.4**2 + 2.5))
 
+    def test_duplicate_buffer_points_are_averaged_before_interpolation(self):
+        result = subtract_buffer(
+            np.array([0.5, 1.0]),
+            np.array([10.0, 10.0]),
+            np.array([0.0, 0.0]),
+            np.array([1.0, 0.0, 1.0, 2.0]),
+            np.array([3.0, 2.0, 5.0, 6.0]),
+            np.array([1.0, 2.0, 3.0, 1.0]),
+            alpha_uncertainty=0.0,
+        )
+
+        # Duplicates at q=1 give I=4 and Var(mean)=(1²+3²)/2²=2.5.
+        np.testing.assert_allclose(result.i_subtracted, [7.0, 6.0])
+        np.testing.assert_allclose(
+            result.err_subtracted, [np.sqrt(0.25 * 4.0 + 0.25 * 2.5), np.sqrt(2.5)]
+        )
+
     def test_alpha_uncertainty_is_propagated_from_buffer_intensity(self):
         q = np.array([0.01, 0.02, 0.03])
         result = subtract_buffer(
@@ -121,7 +142,7 @@ class TestSubtractBuffer:
 
     @pytest.mark.parametrize("alpha_uncertainty", [-0.1, np.inf, np.nan])
     def test_invalid_alpha_uncertainty_raises(self, alpha_uncertainty):
-        q, i_s, e_s, i_b, e_b = self._make_data(n=5)
+        q, i_s, e_s, i_b, e_b = _make_buffer_data(n=5)
         with pytest.raises(ValueError, match="alpha_uncertainty"):
             subtract_buffer(
                 q,
@@ -133,18 +154,27 @@ class TestSubtractBuffer:
                 alpha_uncertainty=alpha_uncertainty,
             )
 
-    def test_interpolation_different_grids(self):
-        n = 100
-        q_s = np.linspace(0.01, 0.30, n)
-        q_b = np.linspace(0.005, 0.35, 200)
-        i_s = np.ones(n) * 10.0
-        i_b = np.ones(200) * 3.0
-        err_s = np.full(n, 0.1)
-        err_b = np.full(200, 0.05)
+    def test_interpolation_different_grids(self, interp_grids):
+        q_s, i_s, err_s, q_b, i_b, err_b = interp_grids
         result = subtract_buffer(q_s, i_s, err_s, q_b, i_b, err_b, alpha=1.0)
         assert result.q.shape == q_s.shape
         np.testing.assert_allclose(result.i_subtracted, 7.0, atol=0.1)
 
+    def test_shared_q_array_skips_interpolation(self, monkeypatch):
+        from saxsabs.core import buffer_subtraction
+
+        q, i_s, err_s, i_b, err_b = _make_buffer_data(20)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("shared grid must not be interpolated")
+
+        monkeypatch.setattr(buffer_subtraction, "_interpolate_buffer_on_grid", fail)
+        result = subtract_buffer(q, i_s, err_s, q, i_b, err_b, alpha_uncertainty=0.0)
+
+        np.testing.assert_allclose(result.i_subtracted, i_s - i_b)
+        assert buffer_subtraction._is_same_q_grid(q, q[:])
+        assert not buffer_subtraction._is_same_q_grid(q, q[::-1])
+
     def test_close_but_distinct_q_grids_are_still_interpolated(self):
         q_s = np.array([0.1, 0.2, 0.3])
         q_b = np.array([0.099999, 0.200001, 0.300001])
@@ -195,25 +225,59 @@ class TestSubtractBuffer:
             subtract_buffer(q, i_s, err_sample, q, i_b, err_buffer, alpha=1.0)
 
 
+class TestSubtractBufferBatch:
+    def test_batch_matches_per_sample_subtraction(self):
+        rng = np.random.default_rng(7)
+        q = np.linspace(0.01, 0.30, 60)
+        i_samples = 50.0 / q + 5.0 + rng.normal(0.0, 0.1, size=(4, q.size))
+        err_samples = np.full_like(i_samples, 0.1)
+        err_samples[1, 3] = np.nan
+        q_b = np.linspace(0.005, 0.31, 45)
+        i_b = 5.0 + 0.5 * q_b
+        err_b = np.full_like(q_b, 0.05)
+        alphas = np.array([0.95, 1.0, 1.05, 1.1])
+
+        batch = subtract_buffer_batch(
+            q, i_samples, err_samples, q_b, i_b, err_b, alphas, alpha_uncertainty=0.01
+        )
+
+        assert len(batch) == 4
+        for row, result in enumerate(batch):
+            single = subtract_buffer(
+                q, i_samples[row], err_samples[row], q_b, i_b, err_b,
+                alpha=alphas[row], alpha_uncertainty=0.01,
+            )
+            assert result.alpha == pytest.approx(single.alpha)
+            np.testing.assert_allclose(result.i_subtracted, single.i_subtracted, rtol=1e-14)
+            np.testing.assert_allclose(result.err_subtracted, single.err_subtracted, rtol=1e-14)
+            np.testing.assert_allclose(result.err_statistical, single.err_statistical, rtol=1e-14)
+            assert result.high_q_residual_mean == pytest.approx(single.high_q_residual_mean)
+            assert result.high_q_check_passed == single.high_q_check_passed
+
+    def test_batch_rejects_mismatched_alphas(self):
+        q = np.linspace(0.01, 0.30, 10)
+        i_samples = np.ones((3, q.size))
+
+        with pytest.raises(ValueError, match="alphas"):
+            subtract_buffer_batch(q, i_samples, None, q, np.ones(q.size), None, [1.0, 1.0])
+
+
 class TestValidateAlpha:
     def test_valid_alpha(self):
         # Should not raise or log warnings
         validate_alpha(1.0)
         validate_alpha(0.95)
 
-    def test_alpha_out_of_range_logs_warning(self, caplog):
-        import logging
+    @pytest.mark.parametrize("alpha", [0.5, 1.5])
+    def test_alpha_out_of_range_logs_warning(self, caplog, alpha):
         with caplog.at_level(logging.WARNING):
-            validate_alpha(0.5)
+            validate_alpha(alpha)
         assert "far from 1.0" in caplog.text
 
-    def test_alpha_negative_raises(self):
-        try:
-            validate_alpha(-0.1)
-        except ValueError as exc:
-            assert "must be finite and > 0" in str(exc)
-        else:
-            raise AssertionError("Expected ValueError for negative alpha")
+    @pytest.mark.parametrize("alpha", [-0.1, 0.0, np.nan])
+    def test_alpha_nonpositive_raises(self, alpha):
+        with pytest.raises(ValueError, match="must be finite and > 0"):
+            validate_alpha(alpha)
 
 
 def test_subtract_buffer_preserves_legacy_positional_high_q_window():
@@ -1,17 +1,21 @@
 import hashlib
+import warnings
 
 import numpy as np
 import pytest
 
-from saxsabs.core.calibration import estimate_k_factor_robust
 from saxsabs.constants import (
     NIST_SRM3600_COVERAGE_FACTOR,
     NIST_SRM3600_DATA,
+    NIST_SRM3600_I,
+    NIST_SRM3600_Q,
     NIST_SRM3600_UNCERTAINTY,
     STANDARD_REGISTRY,
     get_reference_data,
     water_dsdw,
 )
+from saxsabs.core import calibration
+from saxsabs.core.calibration import estimate_k_factor_robust
 
 
 def test_estimate_k_factor_robust_basic():
@@ -45,6 +49,74 @@ def test_default_nist_calibration_reports_certificate_aware_k_uncertainty():
     assert out.reference_coverage_factor == pytest.approx(NIST_SRM3600_COVERAGE_FACTOR)
 
 
+def test_default_nist_reference_window_is_cached_between_calls():
+    q = NIST_SRM3600_DATA[:, 0]
+    i_meas = NIST_SRM3600_DATA[:, 1] / 2.5
+    first = estimate_k_factor_robust(q, i_meas, q_window=(0.02, 0.15))
+    second = estimate_k_factor_robust(q, i_meas * 2.0, q_window=(0.02, 0.15))
+
+    window = calibration._builtin_reference_window(0.02, 0.15)
+    assert window is calibration._builtin_reference_window(0.02, 0.15)
+    assert not window[0].flags.writeable
+    assert first.points_total == second.points_total == window[0].size
+    assert second.k_factor == pytest.approx(first.k_factor / 2.0)
+
+
+def test_interp_sorted_matches_numpy_interp_including_clamping():
+    xp = np.array([0.01, 0.02, 0.05, 0.10])
+    fp = np.array([4.0, 3.0, -1.0, 2.0])
+    x = np.array([0.0, 0.01, 0.015, 0.05, 0.07, 0.10, 0.2])
+
+    np.testing.assert_allclose(
+        calibration._interp_sorted(x, xp, fp), np.interp(x, xp, fp), rtol=0, atol=1e-15
+    )
+
+
+@pytest.mark.parametrize("size", [5, 6])
+def test_robust_median_mad_matches_numpy_and_preserves_input(size):
+    values = np.random.default_rng(3).lognormal(size=size)
+    original = values.copy()
+
+    median, mad, abs_dev = calibration._robust_median_mad(values)
+
+    np.testing.assert_array_equal(values, original)
+    assert median == np.median(original)
+    np.testing.assert_array_equal(abs_dev, np.abs(original - median))
+    assert mad == np.median(np.abs(original - median))
+
+
+def test_single_precision_ratio_path_matches_double_precision():
+    q = NIST_SRM3600_DATA[:, 0]
+    i_meas = NIST_SRM3600_DATA[:, 1] / 123.4
+
+    ref = estimate_k_factor_robust(q, i_meas)
+    out = estimate_k_factor_robust(q, i_meas, precision="f32")
+
+    assert out.ratios_used.dtype == np.float32
+    assert isinstance(out.k_factor, float)
+    assert out.k_factor == pytest.approx(ref.k_factor, rel=1e-6)
+    assert out.points_used == ref.points_used
+
+
+@pytest.mark.parametrize("scale", [1e40, 1e-40])
+def test_single_precision_rejects_intensities_outside_float32_range(scale):
+    q = NIST_SRM3600_DATA[:, 0]
+    i_meas = NIST_SRM3600_DATA[:, 1] / 123.4
+    i_meas[5:8] *= scale
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        for values in (i_meas, np.full_like(i_meas, scale)):
+            with pytest.raises(ValueError, match="precision='f64'"):
+                estimate_k_factor_robust(q, values, positive_floor=0.0, precision="f32")
+
+
+def test_unknown_precision_raises():
+    q = np.array([0.01, 0.02, 0.03, 0.04], dtype=float)
+    with pytest.raises(ValueError, match="precision"):
+        estimate_k_factor_robust(q, np.ones(4), q_ref=q, i_ref=np.ones(4), precision="f16")
+
+
 def test_custom_reference_does_not_treat_unknown_systematic_uncertainty_as_zero():
     q = np.array([0.01, 0.02, 0.03, 0.04], dtype=float)
     i_ref = np.array([10.0, 8.0, 6.0, 4.0], dtype=float)
@@ -219,6 +291,16 @@ class TestStandardRegistry:
         )
         assert ref.coverage_factor == pytest.approx(2.4231)
 
+    def test_srm3600_registry_columns_are_contiguous_and_read_only(self):
+        ref = STANDARD_REGISTRY["SRM3600"]
+        for column in (ref.q_data, ref.i_data):
+            assert column.flags.c_contiguous
+            assert not column.flags.writeable
+        assert ref.q_data is NIST_SRM3600_Q
+        assert ref.i_data is NIST_SRM3600_I
+        np.testing.assert_array_equal(NIST_SRM3600_Q, NIST_SRM3600_DATA[:, 0])
+        np.testing.assert_array_equal(NIST_SRM3600_I, NIST_SRM3600_DATA[:, 1])
+
     def test_water_in_registry(self):
         assert "Water_20C" in STANDARD_REGISTRY
         ref = STANDARD_REGISTRY["Water_20C"]
@@ -257,6 +339,17 @@ class TestWaterDsdw:
             water_dsdw(temperature_c)
 
 
+@pytest.fixture(scope="module")
+def water_refs():
+    """Water curves at 15 and 25 °C on a shared 20-point q grid, keyed by temperature."""
+    return {
+        temperature: get_reference_data(
+            "Water_20C", temperature_C=temperature, q_range=(0.01, 0.20), n_points=20
+        )
+        for temperature in (15.0, 25.0)
+    }
+
+
 class TestGetReferenceData:
     def test_srm3600(self):
         q_ref, i_ref = get_reference_data("SRM3600")
@@ -269,12 +362,25 @@ class TestGetReferenceData:
         assert len(q_ref) == 50
         assert np.allclose(i_ref, water_dsdw(20.0), rtol=0.01)
 
-    def test_water_custom_temperature(self):
-        q15, i15 = get_reference_data("Water_20C", temperature_C=15.0, q_range=(0.01, 0.20), n_points=20)
-        q25, i25 = get_reference_data("Water_20C", temperature_C=25.0, q_range=(0.01, 0.20), n_points=20)
+    def test_water_custom_temperature(self, water_refs):
+        q15, i15 = water_refs[15.0]
+        q25, i25 = water_refs[25.0]
+        np.testing.assert_array_equal(q15, q25)
         # 25°C water scatters slightly more than 15°C
         assert i25[0] > i15[0]
 
+    def test_builtin_curves_are_cached_and_read_only(self):
+        q_a, i_a = get_reference_data("SRM3600")
+        q_b, i_b = get_reference_data("SRM3600")
+        assert q_a is q_b and i_a is i_b
+        w_a = get_reference_data("Water_20C", temperature_C=25.0, n_points=30)
+        w_b = get_reference_data("Water_20C", temperature_C=25, n_points=30)
+        assert w_a[0] is w_b[0] and w_a[1] is w_b[1]
+        for arr in (q_a, i_a, *w_a):
+            assert not arr.flags.writeable
+            with pytest.raises(ValueError):
+                arr[0] = 0.0
+
     def test_custom_user_data(self):
         q_user = np.linspace(0.01, 0.2, 10)
         i_user = np.ones(10) * 42.0
@@ -374,6 +480,33 @@ def test_builtin_nist_parallelism_qc_accepts_explicit_stricter_tolerance():
     assert out.parallelism_check_passed is True
 
 
+def test_estimate_k_factor_averages_duplicate_measured_q_values():
+    q_ref = np.array([0.01, 0.02, 0.03, 0.04], dtype=float)
+    i_ref = np.full(4, 12.0)
+    q_meas = np.array([0.04, 0.01, 0.02, 0.02, 0.03, 0.01], dtype=float)
+    i_meas = np.array([6.0, 5.0, 4.0, 8.0, 6.0, 7.0], dtype=float)
+
+    out = estimate_k_factor_robust(q_meas, i_meas, q_ref=q_ref, i_ref=i_ref)
+
+    assert out.points_total == 4
+    assert out.k_factor == pytest.approx(2.0)
+    assert out.k_std == pytest.approx(0.0, abs=1e-12)
+
+
+@pytest.mark.parametrize(
+    ("q", "i"),
+    [
+        ([0.01, 0.02, 0.03, 0.04], [4.0, 3.0, 2.0, 1.0]),
+        ([0.04, 0.02, 0.03, 0.01], [1.0, 3.0, 2.0, 4.0]),
+    ],
+)
+def test_regularize_profile_sorts_only_when_needed(q, i):
+    q_out, i_out = calibration._regularize_profile(np.array(q), np.array(i))
+
+    np.testing.assert_array_equal(q_out, [0.01, 0.02, 0.03, 0.04])
+    np.testing.assert_array_equal(i_out, [4.0, 3.0, 2.0, 1.0])
+
+
 def test_estimate_k_factor_rejects_duplicate_reference_q_values():
     q_ref = np.array([0.01, 0.02, 0.02, 0.03], dtype=float)
 
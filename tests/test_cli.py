@@ -8,6 +8,46 @@ from saxsabs.cli import main
 from saxsabs.workflows import bl19b2_abs2d
 
 
+# Read-only CLI inputs are written once per session; tests that need a
+# variant of a file still write their own under tmp_path.
+@pytest.fixture(scope="session")
+def cli_inputs(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("cli")
+
+
+@pytest.fixture(scope="session")
+def header_json(cli_inputs: Path) -> Path:
+    path = cli_inputs / "header.json"
+    path.write_text('{"ExposureTime":"1000 ms","I0":"100","Transmission":"80%"}', encoding="utf-8")
+    return path
+
+
+@pytest.fixture(scope="session")
+def meas_csv(cli_inputs: Path) -> Path:
+    path = cli_inputs / "meas.csv"
+    path.write_text("q,i\n0.01,17.1\n0.02,15.4\n0.05,13.4\n0.10,11.8\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture(scope="session")
+def ref_csv(cli_inputs: Path) -> Path:
+    path = cli_inputs / "ref.csv"
+    path.write_text("q,i\n0.01,34.2\n0.02,30.8\n0.05,26.8\n0.10,23.6\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture(scope="session")
+def profile_csv(cli_inputs: Path) -> Path:
+    path = cli_inputs / "profile.csv"
+    path.write_text("q,i,err\n0.01,10,0.2\n0.02,9,0.2\n0.03,8,0.2\n", encoding="utf-8")
+    return path
+
+
+def _stdout_json(capsys: pytest.CaptureFixture[str]):
+    """Decode the JSON document the CLI printed to stdout."""
+    return json.loads(capsys.readouterr().out)
+
+
 def test_cli_norm_factor(capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setattr(
         sys,
@@ -38,23 +78,23 @@ def test_cli_norm_factor_rejects_non_finite_result(
     assert "trans must be 0 < T <= 1" in err
 
 
-def test_cli_parse_header(tmp_path: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch):
-    f = tmp_path / "header.json"
-    f.write_text('{"ExposureTime":"1000 ms","I0":"100","Transmission":"80%"}', encoding="utf-8")
-    monkeypatch.setattr(sys, "argv", ["saxsabs", "parse-header", "--header-json", str(f)])
+def test_cli_parse_header(
+    header_json: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(sys, "argv", ["saxsabs", "parse-header", "--header-json", str(header_json)])
     main()
-    out = json.loads(capsys.readouterr().out)
+    out = _stdout_json(capsys)
     assert out["exp_s"] == 1.0
     assert out["i0"] == 100.0
     assert out["trans"] == 0.8
 
 
-def test_cli_estimate_k(tmp_path: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch):
-    meas = tmp_path / "meas.csv"
-    ref = tmp_path / "ref.csv"
-    meas.write_text("q,i\n0.01,17.1\n0.02,15.4\n0.05,13.4\n0.10,11.8\n", encoding="utf-8")
-    ref.write_text("q,i\n0.01,34.2\n0.02,30.8\n0.05,26.8\n0.10,23.6\n", encoding="utf-8")
-
+def test_cli_estimate_k(
+    meas_csv: Path,
+    ref_csv: Path,
+    capsys: pytest.CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+):
     monkeypatch.setattr(
         sys,
         "argv",
@@ -62,9 +102,9 @@ def test_cli_estimate_k(tmp_path: Path, capsys: pytest.CaptureFixture[str], monk
             "saxsabs",
             "estimate-k",
             "--meas",
-            str(meas),
+            str(meas_csv),
             "--ref",
-            str(ref),
+            str(ref_csv),
             "--qmin",
             "0.01",
             "--qmax",
@@ -72,7 +112,7 @@ def test_cli_estimate_k(tmp_path: Path, capsys: pytest.CaptureFixture[str], monk
         ],
     )
     main()
-    out = json.loads(capsys.readouterr().out)
+    out = _stdout_json(capsys)
     assert out["k_factor"] == pytest.approx(2.0, rel=1e-6)
     assert out["k_std_semantics"] == "inlier ratio scatter; not combined K uncertainty"
     assert out["k_statistical_standard_uncertainty"] == pytest.approx(0.0, abs=1e-12)
@@ -81,6 +121,46 @@ def test_cli_estimate_k(tmp_path: Path, capsys: pytest.CaptureFixture[str], monk
     assert out["coverage_factor"] is None
 
 
+@pytest.mark.parametrize(
+    ("qmin", "qmax", "message"),
+    [
+        ("-0.01", "0.2", "finite and >= 0"),
+        ("nan", "0.2", "finite and >= 0"),
+        ("0.2", "0.01", "--qmin must be smaller than --qmax"),
+    ],
+)
+def test_cli_estimate_k_rejects_invalid_q_window_at_parse_time(
+    qmin: str,
+    qmax: str,
+    message: str,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "saxsabs",
+            "estimate-k",
+            "--meas",
+            str(tmp_path / "missing_meas.csv"),
+            "--ref",
+            str(tmp_path / "missing_ref.csv"),
+            "--qmin",
+            qmin,
+            "--qmax",
+            qmax,
+        ],
+    )
+
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+
+    assert exc_info.value.code == 2
+    assert message in capsys.readouterr().err
+
+
 def test_cli_estimate_k_accepts_common_intensity_column_names(
     tmp_path: Path,
     capsys: pytest.CaptureFixture[str],
@@ -103,7 +183,7 @@ def test_cli_estimate_k_accepts_common_intensity_column_names(
         ["saxsabs", "estimate-k", "--meas", str(meas), "--ref", str(ref)],
     )
     main()
-    out = json.loads(capsys.readouterr().out)
+    out = _stdout_json(capsys)
     assert out["k_factor"] == pytest.approx(2.0, rel=1e-6)
 
 
@@ -129,7 +209,7 @@ def test_cli_estimate_k_accepts_scattering_column_names_with_units(
         ["saxsabs", "estimate-k", "--meas", str(meas), "--ref", str(ref)],
     )
     main()
-    out = json.loads(capsys.readouterr().out)
+    out = _stdout_json(capsys)
     assert out["k_factor"] == pytest.approx(2.0, rel=1e-6)
 
 
@@ -170,22 +250,21 @@ def test_cli_estimate_k_accepts_explicit_column_overrides(
         ],
     )
     main()
-    out = json.loads(capsys.readouterr().out)
+    out = _stdout_json(capsys)
     assert out["k_factor"] == pytest.approx(2.0, rel=1e-6)
 
 
 def test_cli_estimate_k_invalid_override_lists_available_columns(
+    ref_csv: Path,
     tmp_path: Path,
     capsys: pytest.CaptureFixture[str],
     monkeypatch: pytest.MonkeyPatch,
 ):
     meas = tmp_path / "meas.csv"
-    ref = tmp_path / "ref.csv"
     meas.write_text(
         "q,intensity\n0.01,17.1\n0.02,15.4\n0.05,13.4\n0.10,11.8\n",
         encoding="utf-8",
     )
-    ref.write_text("q,i\n0.01,34.2\n0.02,30.8\n0.05,26.8\n0.10,23.6\n", encoding="utf-8")
 
     monkeypatch.setattr(
         sys,
@@ -196,7 +275,7 @@ def test_cli_estimate_k_invalid_override_lists_available_columns(
             "--meas",
             str(meas),
             "--ref",
-            str(ref),
+            str(ref_csv),
             "--q-col",
             "missing_q",
             "--i-col",
@@ -213,13 +292,12 @@ def test_cli_estimate_k_invalid_override_lists_available_columns(
     assert "Available columns: q, intensity" in err
 
 
-def test_cli_parse_external1d(tmp_path: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch):
-    profile = tmp_path / "profile.csv"
-    profile.write_text("q,i,err\n0.01,10,0.2\n0.02,9,0.2\n0.03,8,0.2\n", encoding="utf-8")
-
-    monkeypatch.setattr(sys, "argv", ["saxsabs", "parse-external1d", "--input", str(profile)])
+def test_cli_parse_external1d(
+    profile_csv: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(sys, "argv", ["saxsabs", "parse-external1d", "--input", str(profile_csv)])
     main()
-    out = json.loads(capsys.readouterr().out)
+    out = _stdout_json(capsys)
     assert out["points"] == 3
     assert out["x_col"] == "q"
     assert out["i_col"] == "i"
@@ -267,7 +345,7 @@ def test_cli_bl19b2_abs2d_passes_pydidas_yaml_and_mask_to_workflow(
 
     main()
 
-    out = json.loads(capsys.readouterr().out)
+    out = _stdout_json(capsys)
     config = captured["config"]
     assert out["status"] == "dry-run"
     assert config.input_root == input_root
@@ -325,7 +403,7 @@ def test_cli_bl19b2_abs2d_passes_explicit_reference_paths(
 
     main()
 
-    out = json.loads(capsys.readouterr().out)
+    out = _stdout_json(capsys)
     config = captured["config"]
     assert out["status"] == "dry-run"
     assert config.dark_path == dark
@@ -374,7 +452,7 @@ def test_cli_bl19b2_abs2d_passes_monitor_and_fixed_thickness_modes(
 
     main()
 
-    assert json.loads(capsys.readouterr().out)["status"] == "dry-run"
+    assert _stdout_json(capsys)["status"] == "dry-run"
     assert captured["config"].monitor_mode == "integrated"
     assert captured["config"].sample_thickness_cm == 0.0123
     assert captured["config"].mu_cm_inv is None
@@ -421,7 +499,7 @@ def test_cli_bl19b2_abs2d_passes_manifest_and_thickness_derivation_paths(
 
     main()
 
-    assert json.loads(capsys.readouterr().out)['status'] == 'dry-run'
+    assert _stdout_json(capsys)['status'] == 'dry-run'
     assert captured['config'].include_manifest_path == manifest
     assert captured['config'].thickness_derivation_path == derivation
 
@@ -457,7 +535,7 @@ def test_cli_bl19b2_abs2d_passes_standard_side_and_system_coverage_uncertainties
 
     main()
 
-    assert json.loads(capsys.readouterr().out)["status"] == "dry-run"
+    assert _stdout_json(capsys)["status"] == "dry-run"
     config = captured["config"]
     assert config.standard_transmission_abs_uncertainty == pytest.approx(0.01)
     assert config.standard_monitor_relative_standard_uncertainty == pytest.approx(0.02)
@@ -501,7 +579,7 @@ def test_cli_bl19b2_abs2d_passes_explicit_calibration_controls(
 
     main()
 
-    assert json.loads(capsys.readouterr().out)["status"] == "dry-run"
+    assert _stdout_json(capsys)["status"] == "dry-run"
     config = captured["config"]
     assert config.standard_key == "CUSTOM_STANDARD"
     assert config.correct_solid_angle_for_k is False
@@ -538,7 +616,7 @@ def test_cli_bl19b2_v1_legacy_requires_explicit_historical_assumptions(
 
     main()
 
-    assert json.loads(capsys.readouterr().out)["status"] == "dry-run"
+    assert _stdout_json(capsys)["status"] == "dry-run"
     assert captured["config"].monitor_mode == "rate"
     assert captured["config"].mu_cm_inv == pytest.approx(20.2)
 
@@ -606,7 +684,7 @@ def test_cli_bl19b2_abs2d_returns_nonzero_for_incomplete_scientific_run(
         main()
 
     assert exc_info.value.code == 1
-    assert json.loads(capsys.readouterr().out)["status"] == status
+    assert _stdout_json(capsys)["status"] == status
 
 
 def test_cli_bl19b2_abs2d_rejects_two_geometry_sources(
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from saxsabs.core.execution_policy import (
@@ -8,12 +9,14 @@ from saxsabs.core.execution_policy import (
 )
 
 
+@pytest.mark.fast
 def test_run_policy_mode_resolution():
     assert RunPolicy(resume_enabled=True, overwrite_existing=False).mode == "resume-skip"
     assert RunPolicy(resume_enabled=True, overwrite_existing=True).mode == "overwrite"
     assert RunPolicy(resume_enabled=False, overwrite_existing=False).mode == "always-run"
 
 
+@pytest.mark.fast
 def test_should_skip_existing_behavior():
     policy = RunPolicy(resume_enabled=True, overwrite_existing=False)
     assert policy.should_skip_existing(True) is True
@@ -23,6 +26,7 @@ def test_should_skip_existing_behavior():
     assert policy_overwrite.should_skip_existing(True) is False
 
 
+@pytest.mark.fast
 def test_should_skip_all_existing():
     policy = RunPolicy(resume_enabled=True, overwrite_existing=False)
     assert should_skip_all_existing([True, True, True], policy) is True
@@ -30,7 +34,20 @@ def test_should_skip_all_existing():
     assert should_skip_all_existing([], policy) is False
 
 
+def test_should_skip_all_existing_accepts_bool_arrays_and_resolves_policy_first():
+    policy = RunPolicy(resume_enabled=True, overwrite_existing=False)
+    assert should_skip_all_existing(np.ones(10_000, dtype=bool), policy) is True
+    assert should_skip_all_existing(np.array([True, False]), policy) is False
+    assert should_skip_all_existing(np.array([], dtype=bool), policy) is False
+
+    overwrite = RunPolicy(resume_enabled=True, overwrite_existing=True)
+    always_run = RunPolicy(resume_enabled=False, overwrite_existing=False)
+    assert should_skip_all_existing([True, True], overwrite) is False
+    assert should_skip_all_existing(np.ones(3, dtype=bool), always_run) is False
+
+
 
+@pytest.mark.fast
 def test_parse_run_policy_casts_flags():
     policy = parse_run_policy(resume_enabled=1, overwrite_existing=0)
     assert policy.resume_enabled is True
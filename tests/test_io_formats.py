@@ -1,52 +1,125 @@
 """Tests for canSAS XML and NXcanSAS HDF5 I/O round-trip."""
 
+import importlib.util
+
 import numpy as np
 import pytest
 
 from saxsabs.io.writers import write_cansas1d_xml, write_nxcansas_h5
-from saxsabs.io.parsers import read_cansas1d_xml, read_external_1d_profile
+from saxsabs.io.parsers import read_cansas1d_xml, read_external_1d_profile, read_nxcansas_h5
+
+# h5py is optional and only the NXcanSAS tests need it; probe for it without
+# importing so collection stays cheap.
+HAVE_H5PY = importlib.util.find_spec("h5py") is not None
+
+
+def _make_profile(n=50):
+    q = np.linspace(0.01, 0.30, n)
+    i_abs = 100.0 / q
+    err = np.full(n, 0.5)
+    return q, i_abs, err
+
+
+@pytest.fixture(scope="module")
+def sas_profile():
+    """Shared read-only ``(q, i_abs, err)`` arrays with 50 points."""
+    arrays = _make_profile()
+    for arr in arrays:
+        arr.setflags(write=False)
+    return arrays
+
+
+@pytest.fixture(scope="module")
+def cansas_xml_path(sas_profile, tmp_path_factory):
+    """canSAS XML file of ``sas_profile`` written once for the read-only tests."""
+    q, i_abs, err = sas_profile
+    xml_path = tmp_path_factory.mktemp("cansas") / "profile.xml"
+    write_cansas1d_xml(xml_path, q, i_abs, err, metadata={"title": "round-trip test"})
+    return xml_path
+
+
+@pytest.fixture(scope="module")
+def nxcansas_h5_path(sas_profile, tmp_path_factory):
+    """NXcanSAS file of ``sas_profile`` written once for the read-only tests."""
+    if not HAVE_H5PY:
+        pytest.skip("h5py is required for NXcanSAS I/O")
+    q, i_abs, err = sas_profile
+    h5_path = tmp_path_factory.mktemp("nxcansas") / "profile.h5"
+    write_nxcansas_h5(h5_path, q, i_abs, err, metadata={"title": "h5 round-trip"})
+    return h5_path
 
 
 # ---------------------------------------------------------------------------
 # canSAS 1D XML round-trip
 # ---------------------------------------------------------------------------
 class TestCanSAS1DXML:
-    def _make_data(self, n=50):
-        q = np.linspace(0.01, 0.30, n)
-        i_abs = 100.0 / q
-        err = np.full(n, 0.5)
-        return q, i_abs, err
-
-    def test_write_read_roundtrip(self, tmp_path):
-        q, i_abs, err = self._make_data()
-        xml_path = tmp_path / "test.xml"
-        write_cansas1d_xml(xml_path, q, i_abs, err, metadata={"title": "round-trip test"})
-        assert xml_path.exists()
-
-        result = read_cansas1d_xml(xml_path)
+    @pytest.mark.parametrize(
+        "reader", [read_cansas1d_xml, read_external_1d_profile], ids=["cansas", "auto-detect"]
+    )
+    def test_write_read_roundtrip(self, sas_profile, cansas_xml_path, reader):
+        q, i_abs, err = sas_profile
+        result = reader(str(cansas_xml_path))
         assert "x" in result
         assert "i_rel" in result
         np.testing.assert_allclose(result["x"], q, rtol=1e-6)
         np.testing.assert_allclose(result["i_rel"], i_abs, rtol=1e-6)
         np.testing.assert_allclose(result["err_rel"], err, rtol=1e-6)
 
-    def test_write_no_error(self, tmp_path):
-        q, i_abs, _ = self._make_data()
+    def test_write_no_error(self, sas_profile, tmp_path):
+        q, i_abs, _ = sas_profile
         xml_path = tmp_path / "no_err.xml"
         write_cansas1d_xml(xml_path, q, i_abs)
         result = read_cansas1d_xml(xml_path)
         np.testing.assert_allclose(result["x"], q, rtol=1e-6)
 
-    def test_auto_detect_xml_extension(self, tmp_path):
-        """read_external_1d_profile should auto-detect .xml files."""
-        q, i_abs, err = self._make_data()
-        xml_path = tmp_path / "auto.xml"
-        write_cansas1d_xml(xml_path, q, i_abs, err)
-        result = read_external_1d_profile(str(xml_path))
-        np.testing.assert_allclose(result["x"], q, rtol=1e-6)
+    def test_streamed_rows_form_valid_document_across_write_blocks(self, tmp_path):
+        import xml.etree.ElementTree as ET
+
+        q, i_abs, err = _make_profile(5000)
+        err[::3] = np.nan
+        xml_path = tmp_path / "large.xml"
+        write_cansas1d_xml(xml_path, q, i_abs, err, metadata={"title": "a<b"})
+
+        root = ET.parse(xml_path).getroot()
+        ns = "{urn:cansas1d:1.1}"
+        rows = root.findall(f"{ns}SASentry/{ns}SASdata/{ns}Idata")
+        assert len(rows) == 5000
+        assert sum(row.find(f"{ns}Idev") is None for row in rows) == len(err[::3])
+        assert root.find(f"{ns}SASentry/{ns}Title").text == "a<b"
+        assert root.find(f"{ns}SASentry/{ns}SASsample") is not None
+
+        result = read_cansas1d_xml(xml_path)
+        np.testing.assert_allclose(result["x"], q, rtol=1e-7)
+        np.testing.assert_allclose(result["i_rel"], i_abs, rtol=1e-7)
+        np.testing.assert_array_equal(np.isnan(result["err_rel"]), np.isnan(err))
+
+    def test_empty_profile_keeps_empty_sasdata(self, tmp_path):
+        xml_path = tmp_path / "empty.xml"
+        write_cansas1d_xml(xml_path, np.array([]), np.array([]))
+        assert b"<SASdata />" in xml_path.read_bytes()
+
+    def test_reads_non_namespaced_document_and_skips_malformed_rows(self, tmp_path):
+        xml_path = tmp_path / "plain.xml"
+        xml_path.write_text(
+            "<SASroot><SASentry><SASdata>"
+            '<Idata><Q>0.2</Q><I unit="1/cm">3</I></Idata>'
+            "<Idata><Q>0.1</Q><I>4</I><Idev>0.5</Idev></Idata>"
+            "<Idata><Q>0.3</Q><I>bad</I></Idata>"
+            '</SASdata><SASprocess><term name="k_factor">2.5</term></SASprocess>'
+            "</SASentry></SASroot>",
+            encoding="utf-8",
+        )
+
+        result = read_cansas1d_xml(xml_path)
+
+        np.testing.assert_array_equal(result["x"], [0.1, 0.2])
+        np.testing.assert_array_equal(result["i_rel"], [4.0, 3.0])
+        np.testing.assert_array_equal(result["err_rel"], [0.5, np.nan])
+        assert result["intensity_unit"] == "1/cm"
+        assert result["operator_provenance"] == {"k_factor": "2.5"}
 
     def test_metadata_preserved(self, tmp_path):
-        q, i_abs, err = self._make_data(10)
+        q, i_abs, err = _make_profile(10)
         xml_path = tmp_path / "meta.xml"
         meta = {
             "title": "SAXS test",
@@ -89,37 +162,40 @@ class TestCanSAS1DXML:
 
 
 # ---------------------------------------------------------------------------
-# NXcanSAS HDF5 round-trip (skip if h5py unavailable)
+# NXcanSAS HDF5 round-trip (skipped if h5py is unavailable)
 # ---------------------------------------------------------------------------
-h5py = pytest.importorskip("h5py")
-from saxsabs.io.parsers import read_nxcansas_h5  # noqa: E402
+@pytest.mark.skipif(not HAVE_H5PY, reason="h5py is required for NXcanSAS I/O")
+class TestNXcanSASHDF5:
+    @pytest.mark.parametrize(
+        "reader", [read_nxcansas_h5, read_external_1d_profile], ids=["nxcansas", "auto-detect"]
+    )
+    def test_write_read_roundtrip(self, sas_profile, nxcansas_h5_path, reader):
+        q, i_abs, err = sas_profile
+        result = reader(str(nxcansas_h5_path))
+        np.testing.assert_array_equal(result["x"], q)
+        np.testing.assert_array_equal(result["i_rel"], i_abs)
+        np.testing.assert_array_equal(result["err_rel"], err)
 
+    def test_profile_datasets_are_compressed_and_dtype_is_selectable(self, tmp_path):
+        import h5py
 
-class TestNXcanSASHDF5:
-    def _make_data(self, n=50):
-        q = np.linspace(0.01, 0.30, n)
-        i_abs = 100.0 / q
-        err = np.full(n, 0.5)
-        return q, i_abs, err
-
-    def test_write_read_roundtrip(self, tmp_path):
-        q, i_abs, err = self._make_data()
-        h5_path = tmp_path / "test.h5"
-        write_nxcansas_h5(h5_path, q, i_abs, err, metadata={"title": "h5 round-trip"})
-        assert h5_path.exists()
+        q, i_abs, err = _make_profile(10_000)
+        h5_path = tmp_path / "compressed.h5"
+        write_nxcansas_h5(h5_path, q, i_abs, err, dtype=np.float32)
+
+        with h5py.File(h5_path, "r") as f:
+            for name in ("Q", "I", "Idev"):
+                ds = f["sasentry01/sasdata01"][name]
+                assert ds.compression == "gzip"
+                assert ds.shuffle
+                assert ds.chunks == (4096,)
+                assert ds.dtype == np.float32
 
         result = read_nxcansas_h5(h5_path)
-        np.testing.assert_allclose(result["x"], q, rtol=1e-10)
-        np.testing.assert_allclose(result["i_rel"], i_abs, rtol=1e-10)
-        np.testing.assert_allclose(result["err_rel"], err, rtol=1e-10)
-
-    def test_auto_detect_h5_extension(self, tmp_path):
-        """read_external_1d_profile should auto-detect .h5 files."""
-        q, i_abs, err = self._make_data()
-        h5_path = tmp_path / "auto.h5"
-        write_nxcansas_h5(h5_path, q, i_abs, err)
-        result = read_external_1d_profile(str(h5_path))
-        np.testing.assert_allclose(result["x"], q, rtol=1e-10)
+        np.testing.assert_allclose(result["x"], q, rtol=1e-6)
+        assert result["x"].dtype == result["err_rel"].dtype == np.float64
+        with pytest.raises(ValueError, match="dtype"):
+            write_nxcansas_h5(tmp_path / "bad.h5", q, i_abs, dtype=np.int32)
 
     @pytest.mark.parametrize("bad_value", [np.nan, np.inf, -np.inf])
     def test_write_rejects_nonfinite_q(self, tmp_path, bad_value):
@@ -140,12 +216,12 @@ class TestNXcanSASHDF5:
             )
 
 
-    def test_no_error_dataset(self, tmp_path):
-        q, i_abs, _ = self._make_data()
+    def test_no_error_dataset(self, sas_profile, tmp_path):
+        q, i_abs, _ = sas_profile
         h5_path = tmp_path / "no_err.h5"
         write_nxcansas_h5(h5_path, q, i_abs)
         result = read_nxcansas_h5(h5_path)
-        np.testing.assert_allclose(result["x"], q, rtol=1e-10)
+        np.testing.assert_array_equal(result["x"], q)
         assert np.all(np.isnan(result["err_rel"]))
 
     def test_write_shape_mismatch_raises(self, tmp_path):
@@ -157,7 +233,26 @@ class TestNXcanSASHDF5:
         else:
             raise AssertionError("Expected ValueError for mismatched q/i shapes")
 
+    def test_reader_picks_first_sasdata_in_traversal_order(self, tmp_path):
+        import h5py
+
+        h5_path = tmp_path / "nested.h5"
+        with h5py.File(h5_path, "w") as f:
+            entry = f.create_group("sasentry01")
+            for name, scale in (("sasdata02", 2.0), ("sasdata01", 1.0)):
+                data = entry.create_group(name)
+                data.create_dataset("Q", data=np.array([0.1, 0.2]))
+                data.create_dataset("I", data=scale * np.array([10.0, 9.0]))
+            process = entry.create_group("sasprocess01")
+            process.create_dataset("k_factor", data="12.5")
+
+        result = read_nxcansas_h5(h5_path)
+        np.testing.assert_allclose(result["i_rel"], [10.0, 9.0])
+        assert result["operator_provenance"] == {"k_factor": "12.5"}
+
     def test_reader_rejects_malformed_dataset_lengths(self, tmp_path):
+        import h5py
+
         h5_path = tmp_path / "malformed.h5"
         with h5py.File(h5_path, "w") as f:
             entry = f.create_group("sasentry01")
@@ -1,25 +1,43 @@
 import math
 
+import numpy as np
 import pytest
 
-from saxsabs.core.normalization import compute_norm_factor, monitor_norm_formula
+from saxsabs.core.normalization import (
+    INTEGRATED,
+    RATE,
+    compute_norm_factor,
+    compute_norm_factor_batch,
+    get_norm_factor_fn,
+    monitor_norm_formula,
+)
 
 
+@pytest.mark.fast
 def test_monitor_norm_formula():
     assert monitor_norm_formula("rate") == "exp * I0 * T"
     assert monitor_norm_formula("integrated") == "I0 * T"
 
 
+@pytest.mark.fast
 def test_compute_norm_factor_rate_ok():
     out = compute_norm_factor(exp=2.0, mon=100.0, trans=0.8, mode="rate")
     assert out == 160.0
 
 
+@pytest.mark.fast
 def test_compute_norm_factor_integrated_ok():
     out = compute_norm_factor(exp=None, mon=100.0, trans=0.8, mode="integrated")
     assert out == 80.0
 
 
+def test_compute_norm_factor_coerces_header_values_and_mode_spelling():
+    out = compute_norm_factor(exp="2", mon=np.float64(100.0), trans="0.8", mode=" Rate ")
+    assert out == pytest.approx(160.0)
+    assert math.isnan(compute_norm_factor(exp="n/a", mon=1.0, trans=0.5, mode="rate"))
+    assert math.isnan(compute_norm_factor(exp=1.0, mon=math.inf, trans=0.5, mode="integrated"))
+
+
 def test_compute_norm_factor_invalid_inputs_return_nan():
     out1 = compute_norm_factor(exp=1.0, mon=-1.0, trans=0.8, mode="rate")
     out2 = compute_norm_factor(exp=1.0, mon=1.0, trans=0.0, mode="rate")
@@ -34,3 +52,51 @@ def test_compute_norm_factor_invalid_inputs_return_nan():
 def test_compute_norm_factor_unknown_mode_raises_before_missing_inputs():
     with pytest.raises(ValueError, match="Unknown I0 normalization mode"):
         compute_norm_factor(exp=None, mon=None, trans=None, mode="unsupported")
+
+
+@pytest.mark.parametrize("mode", ["rate", "integrated"])
+def test_compute_norm_factor_batch_matches_scalar(mode):
+    exp = np.array([2.0, 1.0, np.nan, 1.0, 0.0, 1.0, np.inf])
+    mon = np.array([100.0, -1.0, 1.0, 1.0, 1.0, np.nan, 1.0])
+    trans = np.array([0.8, 0.8, 0.8, 1.2, 0.5, 0.5, 0.5])
+
+    out = compute_norm_factor_batch(exp, mon, trans, mode)
+
+    expected = [
+        compute_norm_factor(
+            None if math.isnan(e) else e, None if math.isnan(m) else m, t, mode
+        )
+        for e, m, t in zip(exp, mon, trans)
+    ]
+    np.testing.assert_array_equal(out, expected)
+
+
+def test_compute_norm_factor_batch_rate_requires_exposure():
+    with pytest.raises(ValueError, match="exp is required"):
+        compute_norm_factor_batch(None, np.ones(2), np.ones(2), "rate")
+    out = compute_norm_factor_batch(None, np.ones(2), np.full(2, 0.5), "integrated")
+    np.testing.assert_array_equal(out, [0.5, 0.5])
+
+
+def test_compute_norm_factor_batch_shares_mode_parsing_with_scalar_path():
+    out = compute_norm_factor_batch(np.array([2.0]), np.array([100.0]), np.array([0.8]), " Rate ")
+    np.testing.assert_array_equal(out, [compute_norm_factor(2.0, 100.0, 0.8, " Rate ")])
+    for fn in (
+        lambda: compute_norm_factor_batch(None, np.ones(2), np.ones(2), "unsupported"),
+        lambda: get_norm_factor_fn("unsupported"),
+        lambda: monitor_norm_formula("unsupported"),
+    ):
+        with pytest.raises(ValueError, match="Unknown I0 normalization mode: unsupported"):
+            fn()
+
+
+def test_get_norm_factor_fn_resolves_mode_once():
+    rate = get_norm_factor_fn(" RATE ")
+    integrated = get_norm_factor_fn(INTEGRATED)
+
+    assert rate is get_norm_factor_fn(RATE)
+    assert rate(2.0, 100.0, 0.8) == compute_norm_factor(2.0, 100.0, 0.8, RATE)
+    assert integrated(None, 100.0, 0.8) == 80.0
+    assert math.isnan(rate(None, 100.0, 0.8))
+    with pytest.raises(ValueError, match="Unknown I0 normalization mode"):
+        get_norm_factor_fn("unsupported")
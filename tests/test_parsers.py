@@ -1,18 +1,62 @@
 from pathlib import Path
 
 import numpy as np
+import pandas as pd
+import pytest
 
+from saxsabs.io import parsers
 from saxsabs.io.parsers import (
     extract_float,
+    norm_key,
     normalize_transmission,
     parse_header_values,
+    parse_header_values_batch,
     read_external_1d_profile,
 )
 
 
+@pytest.fixture(scope="module")
+def profile_files(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """Read-only profile files written once per module, keyed by layout."""
+    base = tmp_path_factory.mktemp("profiles")
+    contents = {
+        "csv": ("profile.csv", "q,intensity,error\n0.10,100,5\n0.20,90,4\n0.30,80,4\n"),
+        "unsorted_csv": ("unsorted.csv", "q,intensity,error\n0.30,80,4\n0.10,100,5\n0.20,90,4\n"),
+        "dat": ("profile.dat", "# q i sigma\n0.10 10 1\n0.20 20 2\n0.30 30 3\n"),
+    }
+    files = {}
+    for key, (name, text) in contents.items():
+        files[key] = base / name
+        files[key].write_text(text, encoding="utf-8")
+    return files
+
+
 def test_extract_float_accepts_thousands_and_decimal_commas():
-    assert np.isclose(extract_float("1,200,000"), 1200000.0)
-    assert np.isclose(extract_float("0,85"), 0.85)
+    assert extract_float("1,200,000") == pytest.approx(1200000.0)
+    assert extract_float("0,85") == pytest.approx(0.85)
+
+
+def test_extract_float_fast_path_keeps_pattern_semantics():
+    assert extract_float("0.85") == 0.85
+    assert extract_float("1.2e6") == 1.2e6
+    assert extract_float("200 ms") == 200.0
+    assert extract_float("1_000") == 1.0
+    assert extract_float("1.e5") == 1.0
+    assert extract_float("nan") is None
+    assert extract_float("inf") is None
+
+
+def test_header_string_helpers_are_memoized_on_coerced_strings():
+    parsers._norm_key_str.cache_clear()
+    parsers._extract_float_str.cache_clear()
+
+    assert norm_key("Exposure_Time") == norm_key("Exposure_Time") == "exposuretime"
+    assert extract_float(12.5) == extract_float("12.5") == 12.5
+    assert norm_key(None) == ""
+    assert extract_float(None) is None
+
+    assert parsers._norm_key_str.cache_info().hits == 1
+    assert parsers._extract_float_str.cache_info().hits == 1
 
 
 def test_parse_header_values_ms_and_percent():
@@ -23,9 +67,7 @@ def test_parse_header_values_ms_and_percent():
             "Transmission": "85%",
         }
     )
-    assert np.isclose(exp, 0.2)
-    assert np.isclose(mon, 1.2e6)
-    assert np.isclose(trans, 0.85)
+    np.testing.assert_allclose([exp, mon, trans], [0.2, 1.2e6, 0.85])
 
 
 def test_parse_header_values_us_and_plain_percent_number():
@@ -36,14 +78,12 @@ def test_parse_header_values_us_and_plain_percent_number():
             "sample_transmission": "72",
         }
     )
-    assert np.isclose(exp, 0.0005)
-    assert np.isclose(mon, 10000.0)
-    assert np.isclose(trans, 0.72)
+    np.testing.assert_allclose([exp, mon, trans], [0.0005, 10000.0, 0.72])
 
 
 def test_normalize_transmission_treats_plain_two_as_percent_value():
-    assert np.isclose(normalize_transmission(2.0, raw="2", key="Transmission"), 0.02)
-    assert np.isclose(normalize_transmission(0.85, raw="0.85", key="Transmission"), 0.85)
+    assert normalize_transmission(2.0, raw="2", key="Transmission") == pytest.approx(0.02)
+    assert normalize_transmission(0.85, raw="0.85", key="Transmission") == pytest.approx(0.85)
 
 
 def test_normalize_transmission_rejects_unhinted_near_one_ratio():
@@ -58,42 +98,136 @@ def test_parse_header_values_invalid_transmission_returns_none():
             "Transmission": "105%",
         }
     )
-    assert np.isclose(exp, 1.0)
-    assert np.isclose(mon, 1000.0)
+    np.testing.assert_allclose([exp, mon], [1.0, 1000.0])
     assert trans is None
 
 
-def test_read_external_1d_profile_csv(tmp_path: Path):
-    f = tmp_path / "profile.csv"
+def test_parse_header_values_batch_matches_scalar_parser():
+    headers = [
+        {"ExposureTime": "200 ms", "I0": "1.2e6", "Transmission": "85%"},
+        {"acq_time": "500 us", "monitor": "10000", "sample_transmission": "72"},
+        {"ExposureTime": "1 s", "I0": "1000", "Transmission": "105%"},
+        {},
+        None,
+    ]
+    exp, mon, trans = parse_header_values_batch(headers)
+    assert exp.shape == mon.shape == trans.shape == (len(headers),)
+    for idx, header in enumerate(headers):
+        expected = parse_header_values(header)
+        for arr, value in zip((exp, mon, trans), expected):
+            if value is None:
+                assert np.isnan(arr[idx])
+            else:
+                assert arr[idx] == value
+
+
+def test_read_external_1d_profile_csv(profile_files: dict[str, Path]):
+    out = read_external_1d_profile(profile_files["csv"])
+    assert out["x"].size == 3
+    assert out["x_col"].lower() == "q"
+    assert out["i_col"].lower() == "intensity"
+    assert out["i_rel"][0] == pytest.approx(100.0)
+
+
+def test_read_external_1d_profile_dtype_option(profile_files: dict[str, Path]):
+    f = profile_files["unsorted_csv"]
+
+    out = read_external_1d_profile(f, dtype=np.float32)
+    for key in ("x", "i_rel", "err_rel"):
+        assert out[key].dtype == np.float32
+        assert out[key].flags.c_contiguous
+    np.testing.assert_array_equal(out["x"], np.array([0.1, 0.2, 0.3], dtype=np.float32))
+    assert read_external_1d_profile(f)["x"].dtype == np.float64
+    with pytest.raises(ValueError, match="dtype"):
+        read_external_1d_profile(f, dtype=np.int64)
+
+
+def test_read_external_1d_profile_columns_are_views_of_profile_block(
+    profile_files: dict[str, Path],
+):
+    out = read_external_1d_profile(profile_files["unsorted_csv"])
+    profile = out["profile"]
+    assert profile.shape == (3, 3)
+    for col, key in enumerate(("x", "i_rel", "err_rel")):
+        assert np.shares_memory(out[key], profile)
+        np.testing.assert_array_equal(out[key], profile[:, col])
+    np.testing.assert_array_equal(profile[0], [0.1, 100.0, 5.0])
+
+
+def test_read_external_1d_profile_space_delimited(profile_files: dict[str, Path]):
+    out = read_external_1d_profile(profile_files["dat"])
+    assert out["x"].size == 3
+    assert np.isfinite(out["err_rel"]).all()
+    assert out["err_col"].lower() == "sigma"
+
+
+def test_read_external_1d_profile_keeps_delimited_header_labels_with_units(tmp_path: Path):
+    f = tmp_path / "profile_units.csv"
     f.write_text(
-        "q,intensity,error\n"
+        "q (1/A),I (a.u.),sigma\n"
         "0.10,100,5\n"
         "0.20,90,4\n"
-        "0.30,80,4\n",
+        "0.30,80,3\n",
         encoding="utf-8",
     )
 
     out = read_external_1d_profile(f)
-    assert out["x"].size == 3
-    assert out["x_col"].lower() == "q"
-    assert out["i_col"].lower() == "intensity"
-    assert np.isclose(out["i_rel"][0], 100.0)
+    assert out["x_col"] == "q (1/A)"
+    assert out["i_col"] == "I (a.u.)"
+    np.testing.assert_allclose(out["i_rel"], [100.0, 90.0, 80.0])
+    np.testing.assert_allclose(out["err_rel"], [5.0, 4.0, 3.0])
 
 
-def test_read_external_1d_profile_space_delimited(tmp_path: Path):
-    f = tmp_path / "profile.dat"
+def test_read_external_1d_profile_falls_back_for_ragged_rows(tmp_path: Path):
+    f = tmp_path / "ragged.dat"
     f.write_text(
-        "# q i sigma\n"
-        "0.10 10 1\n"
-        "0.20 20 2\n"
-        "0.30 30 3\n",
+        "q I\n"
+        "0.10 100\n"
+        "0.20, 90\n"
+        "0.30;80\n",
         encoding="utf-8",
     )
 
+    assert parsers._read_sniffed_dataframe(f) is None
     out = read_external_1d_profile(f)
-    assert out["x"].size == 3
-    assert np.isfinite(out["err_rel"]).all()
-    assert out["err_col"].lower() == "sigma"
+    np.testing.assert_allclose(out["i_rel"], [100.0, 90.0, 80.0])
+
+
+def test_read_external_1d_profile_comment_header_over_tab_delimited_body(tmp_path: Path):
+    f = tmp_path / "profile_tabs.dat"
+    f.write_text(
+        "# q\tI\tsigma\n"
+        "  0.30\t30\t3\n"
+        "  0.10\t10\t1\n"
+        "  0.20\t20\tnan\n",
+        encoding="utf-8",
+    )
+
+    out = read_external_1d_profile(f)
+    assert (out["x_col"], out["i_col"], out["err_col"]) == ("q", "I", "sigma")
+    np.testing.assert_array_equal(out["x"], [0.1, 0.2, 0.3])
+    np.testing.assert_array_equal(out["err_rel"], [1.0, np.nan, 3.0])
+
+
+def test_read_external_1d_profile_stops_trials_after_clean_frame(tmp_path: Path, monkeypatch):
+    f = tmp_path / "long.csv"
+    rows = "".join(f"{0.01 * (k + 1):.4f},{1000.0 / (k + 1):.4f},1.0\n" for k in range(150))
+    f.write_text("q,intensity,error\n" + rows, encoding="utf-8")
+
+    calls = []
+    real_read_csv = pd.read_csv
+
+    def counting_read_csv(*args, **kwargs):
+        calls.append(kwargs)
+        return real_read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(parsers, "_read_sniffed_dataframe", lambda _path: None)
+    monkeypatch.setattr(pd, "read_csv", counting_read_csv)
+    out = read_external_1d_profile(f)
+
+    assert len(calls) == 1
+    assert out["x"].size == 150
+    assert out["i_col"] == "intensity"
 
 
 def test_read_external_1d_profile_uses_real_comment_header_after_description(tmp_path: Path):
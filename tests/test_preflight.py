@@ -20,3 +20,12 @@ def test_preflight_caution_when_warnings_or_risky_exist():
 
     out_risky = evaluate_preflight_gate(total_files=10, failed_files=0, warning_count=0, risky_files=2)
     assert out_risky.level == "CAUTION"
+
+
+def test_preflight_ready_summary_is_shared_per_total():
+    first = evaluate_preflight_gate(total_files=10, failed_files=0, warning_count=0)
+    second = evaluate_preflight_gate(total_files=10, failed_files=0, warning_count=0)
+    other = evaluate_preflight_gate(total_files=11, failed_files=0, warning_count=0)
+
+    assert first is second
+    assert other.total_files == 11
@@ -210,6 +210,7 @@ def test_run_with_error_handling_writes_user_log_and_shows_messagebox(
     monkeypatch.chdir(cwd)
     monkeypatch.setattr(launcher, "_candidate_log_directories", lambda: (user_log_dir,))
     monkeypatch.setattr(launcher, "_ACTIVE_LOG_PATH", None)
+    monkeypatch.setenv("DISPLAY", ":0")
     shown_messages = []
 
     class FakeTk:
@@ -241,6 +242,21 @@ def test_run_with_error_handling_writes_user_log_and_shows_messagebox(
     assert str(error_log) in shown_messages[0][1]
 
 
+def test_show_launch_error_skips_tk_without_display(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(launcher.sys, "platform", "linux")
+    monkeypatch.delenv("DISPLAY", raising=False)
+    monkeypatch.delenv("WAYLAND_DISPLAY", raising=False)
+
+    def fail_tk() -> None:
+        raise AssertionError("Tk must not be initialized without a display")
+
+    monkeypatch.setattr(launcher.tk, "Tk", fail_tk)
+
+    launcher._show_launch_error(tmp_path / "launch_error.log")
+
+
 def test_run_with_error_handling_degrades_when_no_log_directory_is_writable(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ):